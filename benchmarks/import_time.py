@@ -0,0 +1,80 @@
+"""
+Measure how long ``import fmpsdk`` takes in a fresh interpreter.
+
+Usage:
+    python benchmarks/import_time.py [--runs 20] [--max-ms 50]
+
+Exits with status 1 when the median import time exceeds --max-ms, or when a bare
+``import fmpsdk`` pulls in a heavy dependency (requests, urllib3, aiohttp); both mean
+the lazy loading in fmpsdk/__init__.py has regressed.  "from fmpsdk import quote" is
+timed too, for comparison.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("requests", "urllib3", "aiohttp")
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed * 1000)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure(statement: str, runs: int):
+    """Return (times in ms, heavy modules loaded) for statement over runs fresh processes."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    code = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    times, loaded = [], set()
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.splitlines()
+        times.append(float(out[0]))
+        loaded.update(filter(None, out[1].split(",")))
+    return times, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so the first run is not an outlier.
+    measure("import fmpsdk; fmpsdk.quote", 1)
+
+    status = 0
+    for statement, guarded in (
+        ("import fmpsdk", True),
+        ("from fmpsdk import quote", False),
+    ):
+        times, loaded = measure(statement, args.runs)
+        median = statistics.median(times)
+        print(
+            f"{statement:<28} median {median:7.2f} ms   "
+            f"min {min(times):7.2f} ms   loaded: {', '.join(sorted(loaded)) or '-'}"
+        )
+        if guarded and median > args.max_ms:
+            print(f"  FAIL: slower than {args.max_ms} ms")
+            status = 1
+        if guarded and loaded:
+            print(f"  FAIL: imports {', '.join(sorted(loaded))}")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
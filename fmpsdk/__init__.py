@@ -1,162 +1,268 @@
-import logging
+"""
+Python SDK for the Financial Modeling Prep API.
 
-from .alternative_data import (
-    commitment_of_traders_report,
-    commitment_of_traders_report_analysis,
-    commitment_of_traders_report_list,
-)
-from .bulk import bulk_historical_eod, bulk_profiles, batch_quote, batch_pre_post_market_trade, scores_bulk, upgrades_downgrades_consensus_bulk
-from .calendar import (
-    dividend_calendar,
-    earning_calendar,
-    earning_calendar_confirmed,
-    economic_calendar,
-    historical_earning_calendar,
-    ipo_calendar,
-    ipo_calendar_confirmed,
-    stock_split_calendar,
-)
-from .commodities import available_commodities, commodities_list
-from .company_valuation import (
-    available_industries,
-    available_traded_list,
-    balance_sheet_statement,
-    balance_sheet_statement_as_reported,
-    balance_sheet_statement_growth,
-    cash_flow_statement,
-    cash_flow_statement_as_reported,
-    cash_flow_statement_growth,
-    company_profile,
-    delisted_companies,
-    discounted_cash_flow,
-    earnings_surprises,
-    enterprise_values,
-    etf_list,
-    financial_growth,
-    financial_ratios,
-    financial_ratios_ttm,
-    financial_statement,
-    financial_statement_full_as_reported,
-    financial_statement_symbol_lists,
-    historical_daily_discounted_cash_flow,
-    historical_discounted_cash_flow,
-    historical_employee_count,
-    historical_market_capitalization,
-    historical_rating,
-    income_statement,
-    income_statement_as_reported,
-    income_statement_growth,
-    key_executives,
-    key_metrics,
-    key_metrics_ttm,
-    market_capitalization,
-    press_releases,
-    rating,
-    search,
-    search_ticker,
-    sec_filings,
-    social_sentiments,
-    stock_news,
-    stock_screener,
-    symbols_list,
-    upgrades_downgrades_consensus,
-    analyst_estimates,
-    analyst_recommendations,
-    upgrades_downgrades,
-    price_target,
-    price_target_consensus,
-)
-from .cryptocurrencies import (
-    available_cryptocurrencies,
-    crypto_news,
-    cryptocurrencies_list,
-    last_crypto_price,
-)
-from .etf import available_efts, available_etfs, etf_price_realtime
-from .euronext import available_euronext, euronext_list
-from .forex import available_forex, forex, forex_list, forex_news
-from .general import historical_chart, historical_price_full, quote
-from .insider_trading import (
-    insider_trading,
-    insider_trading_latest,
-    insider_trading_by_reporting_name,
-    insider_trading_transaction_types,
-    insider_trading_statistics,
-    acquisition_of_beneficial_ownership,
+Names are resolved on first use (see __getattr__ below), so ``import fmpsdk`` stays
+cheap and only the submodules a program touches, and their dependencies such as
+requests, are ever imported.
+"""
 
-    insider_trading_rss_feed,
-    mapper_cik_company,
-    mapper_cik_name,
-)
-from .institutional_fund import (
-    cik,
-    cik_list,
-    cik_search,
-    cusip,
-    etf_country_weightings,
-    etf_holders,
-    etf_sector_weightings,
-    form_13f,
-    institutional_holders,
-    mutual_fund_holders,
-    sec_rss_feeds,
-)
-from .market_indexes import (
-    available_indexes,
-    available_sectors,
-    dowjones_constituent,
-    historical_dowjones_constituent,
-    historical_nasdaq_constituent,
-    historical_sectors_performance,
-    historical_sp500_constituent,
-    indexes,
-    nasdaq_constituent,
-    sp500_constituent,
-    all_exchange_market_hours,
-)
-from .mutual_funds import available_mutual_funds, mutual_fund_list
-from .news import (
-    fmp_articles,
-    general_news,
-    news_sentiment_rss,
-    sentiment_change,
-    trending_sentiment,
-    mergers_acquisitions_rss_feed,
-)
-from .senate import (
-    senate_disclosure_rss,
-    senate_disclosure_symbol,
-    senate_trading_rss,
-    senate_trading_symbol,
-)
-from .shares_float import shares_float
-from .stock_market import (
-    actives,
-    gainers,
-    losers,
-    market_hours,
-    market_open,
-    sectors_performance,
-    biggest_gainers,
-    biggest_losers,
-    most_actives,
-)
-from .stock_time_series import (
-    exchange_realtime,
-    historical_stock_dividend,
-    historical_stock_split,
-    historical_survivorship_bias_free_eod,
-    quote_short,
-    live_full_price,
-    full_real_time_price,
-)
-from .technical_indicators import technical_indicators
-from .tsx import available_tsx, tsx_list
-from .economic_indicators import economic_indicator, treasury_rates
+import importlib
+import logging
+import sys
+import types
+import typing
 
 attribution: str = "Data provided by Financial Modeling Prep"
 logging.info(attribution)
 
+# Public name -> submodule that defines it.
+_EXPORTS: typing.Dict[str, str] = {
+    # alternative_data
+    "commitment_of_traders_report": "alternative_data",
+    "commitment_of_traders_report_analysis": "alternative_data",
+    "commitment_of_traders_report_list": "alternative_data",
+    # bar_files
+    "BarFiles": "bar_files",
+    # batching
+    "SymbolRows": "batching",
+    # bulk
+    "batch_pre_post_market_trade": "bulk",
+    "batch_quote": "bulk",
+    "bulk_historical_eod": "bulk",
+    "bulk_profiles": "bulk",
+    "scores_bulk": "bulk",
+    "upgrades_downgrades_consensus_bulk": "bulk",
+    # cache
+    "configure_cache": "cache",
+    # calendar
+    "dividend_calendar": "calendar",
+    "earning_calendar": "calendar",
+    "earning_calendar_confirmed": "calendar",
+    "economic_calendar": "calendar",
+    "historical_earning_calendar": "calendar",
+    "ipo_calendar": "calendar",
+    "ipo_calendar_confirmed": "calendar",
+    "stock_split_calendar": "calendar",
+    # client
+    "FMPClient": "client",
+    # columnar
+    "fetch_columns": "columnar",
+    # commodities
+    "available_commodities": "commodities",
+    "commodities_list": "commodities",
+    # company_valuation
+    "analyst_estimates": "company_valuation",
+    "analyst_recommendations": "company_valuation",
+    "available_industries": "company_valuation",
+    "available_traded_list": "company_valuation",
+    "balance_sheet_statement": "company_valuation",
+    "balance_sheet_statement_as_reported": "company_valuation",
+    "balance_sheet_statement_growth": "company_valuation",
+    "cash_flow_statement": "company_valuation",
+    "cash_flow_statement_as_reported": "company_valuation",
+    "cash_flow_statement_growth": "company_valuation",
+    "company_profile": "company_valuation",
+    "delisted_companies": "company_valuation",
+    "discounted_cash_flow": "company_valuation",
+    "earnings_surprises": "company_valuation",
+    "enterprise_values": "company_valuation",
+    "etf_list": "company_valuation",
+    "financial_growth": "company_valuation",
+    "financial_ratios": "company_valuation",
+    "financial_ratios_ttm": "company_valuation",
+    "financial_statement": "company_valuation",
+    "financial_statement_full_as_reported": "company_valuation",
+    "financial_statement_symbol_lists": "company_valuation",
+    "historical_daily_discounted_cash_flow": "company_valuation",
+    "historical_discounted_cash_flow": "company_valuation",
+    "historical_employee_count": "company_valuation",
+    "historical_market_capitalization": "company_valuation",
+    "historical_rating": "company_valuation",
+    "income_statement": "company_valuation",
+    "income_statement_as_reported": "company_valuation",
+    "income_statement_growth": "company_valuation",
+    "key_executives": "company_valuation",
+    "key_metrics": "company_valuation",
+    "key_metrics_ttm": "company_valuation",
+    "market_capitalization": "company_valuation",
+    "press_releases": "company_valuation",
+    "price_target": "company_valuation",
+    "price_target_consensus": "company_valuation",
+    "rating": "company_valuation",
+    "search": "company_valuation",
+    "search_ticker": "company_valuation",
+    "sec_filings": "company_valuation",
+    "social_sentiments": "company_valuation",
+    "stock_news": "company_valuation",
+    "stock_screener": "company_valuation",
+    "symbols_list": "company_valuation",
+    "upgrades_downgrades": "company_valuation",
+    "upgrades_downgrades_consensus": "company_valuation",
+    # concurrency
+    "FetchResult": "concurrency",
+    "fetch_many": "concurrency",
+    # cryptocurrencies
+    "available_cryptocurrencies": "cryptocurrencies",
+    "crypto_news": "cryptocurrencies",
+    "cryptocurrencies_list": "cryptocurrencies",
+    "last_crypto_price": "cryptocurrencies",
+    # disk_cache
+    "configure_disk_cache": "disk_cache",
+    # download
+    "download_many": "download",
+    # economic_indicators
+    "economic_indicator": "economic_indicators",
+    "treasury_rates": "economic_indicators",
+    # etf
+    "available_efts": "etf",
+    "available_etfs": "etf",
+    "etf_price_realtime": "etf",
+    # euronext
+    "available_euronext": "euronext",
+    "euronext_list": "euronext",
+    # forex
+    "available_forex": "forex",
+    "forex": "forex",
+    "forex_list": "forex",
+    "forex_news": "forex",
+    # export
+    "export_table": "export",
+    # frames
+    "to_frame": "frames",
+    # general
+    "historical_chart": "general",
+    "historical_price_full": "general",
+    "quote": "general",
+    # history_store
+    "HistoryStore": "history_store",
+    # insider_trading
+    "acquisition_of_beneficial_ownership": "insider_trading",
+    "insider_trading": "insider_trading",
+    "insider_trading_by_reporting_name": "insider_trading",
+    "insider_trading_latest": "insider_trading",
+    "insider_trading_rss_feed": "insider_trading",
+    "insider_trading_statistics": "insider_trading",
+    "insider_trading_transaction_types": "insider_trading",
+    "mapper_cik_company": "insider_trading",
+    "mapper_cik_name": "insider_trading",
+    # institutional_fund
+    "cik": "institutional_fund",
+    "cik_list": "institutional_fund",
+    "cik_search": "institutional_fund",
+    "cusip": "institutional_fund",
+    "etf_country_weightings": "institutional_fund",
+    "etf_holders": "institutional_fund",
+    "etf_sector_weightings": "institutional_fund",
+    "form_13f": "institutional_fund",
+    "institutional_holders": "institutional_fund",
+    "mutual_fund_holders": "institutional_fund",
+    "sec_rss_feeds": "institutional_fund",
+    # market_indexes
+    "all_exchange_market_hours": "market_indexes",
+    "available_indexes": "market_indexes",
+    "available_sectors": "market_indexes",
+    "dowjones_constituent": "market_indexes",
+    "historical_dowjones_constituent": "market_indexes",
+    "historical_nasdaq_constituent": "market_indexes",
+    "historical_sectors_performance": "market_indexes",
+    "historical_sp500_constituent": "market_indexes",
+    "indexes": "market_indexes",
+    "nasdaq_constituent": "market_indexes",
+    "sp500_constituent": "market_indexes",
+    # mutual_funds
+    "available_mutual_funds": "mutual_funds",
+    "mutual_fund_list": "mutual_funds",
+    # news
+    "fmp_articles": "news",
+    "general_news": "news",
+    "mergers_acquisitions_rss_feed": "news",
+    "news_sentiment_rss": "news",
+    "sentiment_change": "news",
+    "trending_sentiment": "news",
+    # pagination
+    "iter_pages": "pagination",
+    # polling
+    "QuotePoller": "polling",
+    # rate_limit
+    "configure_rate_limit": "rate_limit",
+    # records
+    "to_objects": "records",
+    # retry
+    "NO_RETRY": "retry",
+    "RetryPolicy": "retry",
+    "configure_retry": "retry",
+    # senate
+    "senate_disclosure_rss": "senate",
+    "senate_disclosure_symbol": "senate",
+    "senate_trading_rss": "senate",
+    "senate_trading_symbol": "senate",
+    # session
+    "close_session": "session",
+    "configure_session": "session",
+    "get_session": "session",
+    # shares_float
+    "shares_float": "shares_float",
+    # stock_market
+    "actives": "stock_market",
+    "biggest_gainers": "stock_market",
+    "biggest_losers": "stock_market",
+    "gainers": "stock_market",
+    "losers": "stock_market",
+    "market_hours": "stock_market",
+    "market_open": "stock_market",
+    "most_actives": "stock_market",
+    "sectors_performance": "stock_market",
+    # stock_time_series
+    "exchange_realtime": "stock_time_series",
+    "full_real_time_price": "stock_time_series",
+    "historical_stock_dividend": "stock_time_series",
+    "historical_stock_split": "stock_time_series",
+    "historical_survivorship_bias_free_eod": "stock_time_series",
+    "live_full_price": "stock_time_series",
+    "quote_short": "stock_time_series",
+    # streaming
+    "iter_batches": "streaming",
+    "iter_rows": "streaming",
+    # technical_indicators
+    "technical_indicators": "technical_indicators",
+    # tsx
+    "available_tsx": "tsx",
+    "tsx_list": "tsx",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import the submodule that defines name on first access (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        # Plain submodule access, e.g. fmpsdk.settings.
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        # Importing a submodule binds it on the package.  forex, insider_trading,
+        # shares_float and technical_indicators are also function names; keep those
+        # resolving to the function, as the eager imports used to.
+        if name in _EXPORTS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
+
 __all__ = [
     "available_industries",
     "quote",
@@ -299,4 +405,41 @@ __all__ = [
     "treasury_rates",
     "scores_bulk",
     "upgrades_downgrades_consensus_bulk",
+    # client
+    "FMPClient",
+    # transport
+    "configure_session",
+    "get_session",
+    "close_session",
+    "configure_rate_limit",
+    "configure_cache",
+    "configure_disk_cache",
+    "configure_retry",
+    "RetryPolicy",
+    "NO_RETRY",
+    # concurrency
+    "fetch_many",
+    "FetchResult",
+    "download_many",
+    # batching
+    "SymbolRows",
+    # streaming
+    "iter_rows",
+    "iter_batches",
+    # columnar
+    "fetch_columns",
+    # frames
+    "to_frame",
+    # export
+    "export_table",
+    # records
+    "to_objects",
+    # pagination
+    "iter_pages",
+    # history_store
+    "HistoryStore",
+    # bar_files
+    "BarFiles",
+    # polling
+    "QuotePoller",
 ]
@@ -0,0 +1,296 @@
+"""
+Awaitable versions of every fmpsdk endpoint function.
+
+Each function here has the same name and arguments as its blocking counterpart, e.g.
+``await fmpsdk.aio.quote(apikey=apikey, symbol="AAPL")``.  The URL and query values
+are built by the regular functions; only the network I/O differs (calls that the
+regular functions split into several requests, such as long date ranges, send them
+concurrently and merge the results the same way).  All calls share
+one aiohttp connection pool; timeouts, retries, caches and rate limiting come from the
+active FMPClient (use ``with client.activate():`` to pick one).
+
+Requires aiohttp: ``pip install fmpsdk[aio]``.
+"""
+
+import asyncio
+import functools
+import logging
+import typing
+
+try:
+    import aiohttp
+except ImportError as e:
+    raise ImportError(
+        "fmpsdk.aio requires aiohttp.  Install it with 'pip install fmpsdk[aio]'."
+    ) from e
+
+from .cache import MISS
+from .disk_cache import get_disk_cache
+from .endpoints import endpoint_functions
+from .rate_limit import FileTokenBucket, get_rate_limiter
+from .retry import get_retry_policy, parse_retry_after
+from .settings import (
+    DEFAULT_ASYNC_POOL_LIMIT,
+    DEFAULT_ASYNC_POOL_LIMIT_PER_HOST,
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
+)
+from .single_flight import AsyncSingleFlight
+from .url_methods import (
+    PreparedRequest,
+    SplitRequest,
+    __atomic_writer,
+    __cache_lookup,
+    __cache_store,
+    __capture_request,
+    __flight_key,
+    __parse_content,
+    __timeout,
+    __verify_length,
+)
+
+_in_flight = AsyncSingleFlight()
+
+_session: typing.Optional[aiohttp.ClientSession] = None
+_session_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+_pool_config: typing.Dict = {
+    "limit": DEFAULT_ASYNC_POOL_LIMIT,
+    "limit_per_host": DEFAULT_ASYNC_POOL_LIMIT_PER_HOST,
+}
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Return the aiohttp session shared by every fmpsdk.aio call on this event loop.
+
+    Must be called from a coroutine.  The session is created on first use.
+    :return: The shared aiohttp.ClientSession.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(**_pool_config)
+        _session = aiohttp.ClientSession(connector=connector)
+        _session_loop = loop
+    return _session
+
+
+async def configure_session(
+    limit: int = DEFAULT_ASYNC_POOL_LIMIT,
+    limit_per_host: int = DEFAULT_ASYNC_POOL_LIMIT_PER_HOST,
+) -> None:
+    """
+    Change the connection pool settings of the shared aiohttp session.
+
+    :param limit: Maximum number of simultaneous connections.
+    :param limit_per_host: Maximum number of simultaneous connections per host (0 is
+        unlimited).
+    :return: None
+    """
+    _pool_config.update({"limit": limit, "limit_per_host": limit_per_host})
+    await close_session()
+
+
+async def close_session() -> None:
+    """
+    Close the shared aiohttp session.  Call this before your event loop exits.
+
+    :return: None
+    """
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+def _params(query_vars: typing.Dict) -> typing.Dict:
+    """aiohttp only accepts str/int/float values; encode the rest like requests does."""
+    return {
+        key: str(value) if isinstance(value, bool) else value
+        for key, value in query_vars.items()
+        if value is not None
+    }
+
+
+async def _throttle() -> None:
+    """Wait, without blocking the event loop, until the rate limiter allows a request."""
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        if isinstance(limiter, FileTokenBucket):
+            # flock() and file I/O, possibly waiting for another process.
+            wait = await asyncio.to_thread(limiter.reserve)
+        else:
+            wait = limiter.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+async def _send(request: PreparedRequest) -> aiohttp.ClientResponse:
+    """
+    Send a GET request, retrying transient failures per the endpoint's RetryPolicy.
+
+    Mirrors url_methods.__send.  The caller must release the returned response.
+    :param request: The request built by an endpoint function.
+    :return: The response.
+    """
+    policy = get_retry_policy(request.base_url, request.path)
+    connect_timeout, read_timeout = __timeout()
+    timeout = aiohttp.ClientTimeout(
+        sock_connect=connect_timeout, sock_read=read_timeout
+    )
+    attempts = max(1, policy.max_attempts)
+    for attempt in range(attempts):
+        last_attempt = attempt + 1 >= attempts
+        retry_after = None
+        await _throttle()
+        try:
+            response = await get_session().get(
+                request.url, params=_params(request.query_vars), timeout=timeout
+            )
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+            if last_attempt:
+                raise
+            logging.warning(f"Request to {request.url} failed ({e}).  Retrying.")
+        else:
+            if response.status not in policy.retry_statuses or last_attempt:
+                return response
+            if response.status in (429, 503):
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if policy.gives_up(retry_after):
+                logging.warning(
+                    f"Request to {request.url} asked to retry after "
+                    f"{retry_after:.0f} s.  Giving up."
+                )
+                return response
+            logging.warning(
+                f"Request to {request.url} returned HTTP {response.status}.  Retrying."
+            )
+            response.release()
+        await asyncio.sleep(policy.delay(attempt, retry_after))
+
+
+async def _return_json(request: PreparedRequest) -> typing.Optional[typing.List]:
+    """
+    Query URL for JSON response.
+
+    :param request: The request built by an endpoint function.
+    :return: JSON response
+    """
+    key, return_var = await _off_loop(
+        __cache_lookup,
+        request.base_url,
+        request.path,
+        request.query_vars,
+        request.transform,
+    )
+    if return_var is not MISS:
+        return return_var
+    return await _in_flight.do(
+        __flight_key(request.base_url, request.path, request.query_vars),
+        lambda: _fetch_json(request, key),
+    )
+
+
+async def _off_loop(func: typing.Callable, *args) -> typing.Any:
+    """
+    Run a cache function, in a worker thread if it may touch the disk cache.
+
+    DiskCache does SQLite I/O and can wait for another process's lock, which must
+    not stall the event loop; the memory cache alone is fast enough to stay on it.
+    asyncio.to_thread() keeps the active FMPClient.
+    """
+    if get_disk_cache() is None:
+        return func(*args)
+    return await asyncio.to_thread(func, *args)
+
+
+async def _fetch_json(
+    request: PreparedRequest, key: typing.Optional[str]
+) -> typing.Optional[typing.List]:
+    """
+    Send the request, parse the response and cache it.
+
+    :param request: The request built by an endpoint function.
+    :param key: Cache key from __cache_lookup(), or None to skip caching.
+    :return: JSON response
+    """
+    url = request.url
+    return_var = None
+    try:
+        async with await _send(request) as response:
+            content = await response.read()
+        return_var = __parse_content(
+            content, request.query_vars, request.transform, request.path
+        )
+        if key is not None and response.ok:
+            await _off_loop(__cache_store, key, request.path, return_var, content)
+    except asyncio.TimeoutError:
+        logging.error(f"Connection to {url} timed out.")
+    except aiohttp.TooManyRedirects:
+        logging.error(
+            f"Request to {url} exceeds the maximum number of predefined redirections."
+        )
+    except aiohttp.ClientConnectionError:
+        logging.error(
+            f"Connection to {url} failed:  DNS failure, refused connection or some other connection related "
+            f"issue."
+        )
+    except Exception as e:
+        logging.error(
+            f"A requests exception has occurred that we have not yet detailed an 'except' clause for.  "
+            f"Error: {e}"
+        )
+    return return_var
+
+
+async def _download(request: PreparedRequest) -> None:
+    """
+    Save the body of a response to request.filename.
+
+    Like url_methods.__download_v3, the body goes to a temporary file that replaces
+    request.filename only once it is complete.
+    :param request: The request built by an endpoint function.
+    :return: None
+    """
+    try:
+        async with await _send(request) as response:
+            response.raise_for_status()
+            with __atomic_writer(request.filename) as f:
+                async for chunk in response.content.iter_chunked(
+                    DEFAULT_DOWNLOAD_CHUNK_SIZE
+                ):
+                    f.write(chunk)
+                # aiohttp only counts decoded bytes; skip the check for gzip bodies.
+                if "Content-Encoding" not in response.headers:
+                    __verify_length(request.url, response.headers, f.tell())
+    except Exception as e:
+        logging.error(f"Download of {request.url} failed.  Error: {e}")
+        return
+    logging.info(f"Saving {request.path} as {request.filename}.")
+
+
+def _awaitable(func: typing.Callable) -> typing.Callable:
+    """Wrap a blocking endpoint function into a coroutine function."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        request, result = __capture_request(func, *args, **kwargs)
+        if request is None:
+            return result
+        if isinstance(request, SplitRequest):
+            results = await asyncio.gather(
+                *[_return_json(part) for part in request.requests]
+            )
+            return request.merge(list(results))
+        if request.filename is not None:
+            return await _download(request)
+        return await _return_json(request)
+
+    return wrapper
+
+
+__all__ = ["get_session", "configure_session", "close_session"]
+
+for _name, _func in endpoint_functions().items():
+    globals()[_name] = _awaitable(_func)
+    __all__.append(_name)
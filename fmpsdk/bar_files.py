@@ -0,0 +1,200 @@
+"""
+An on-disk store of OHLCV bars that readers memory-map instead of parsing.
+
+Each symbol and timeframe gets a directory of fixed-width column files (one raw
+array per field), so any number of backtest processes can open the same data with
+numpy.memmap and share the operating system's page cache.  Writes only append.
+
+Requires numpy: ``pip install fmpsdk[numpy]``.
+"""
+
+import os
+import threading
+import typing
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "fmpsdk.bar_files requires numpy.  Install it with 'pip install fmpsdk[numpy]'."
+    ) from e
+
+from .columnar import DATETIME
+
+# Column file dtypes.  "timestamp" holds the bar's date; it must come first.
+COLUMNS: typing.Dict[str, str] = {
+    "timestamp": DATETIME,
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "int64",
+}
+
+
+class BarFiles:
+    """
+    Per-symbol, per-timeframe column files of OHLCV bars.
+
+    Layout: <root>/<timeframe>/<symbol>/<column>.bin, raw little-endian arrays with
+    the dtypes in COLUMNS, sorted by timestamp.  append() only adds bars newer than
+    the last stored one and writes the timestamp file last, so a reader never sees
+    a bar whose prices are not on disk yet.  Run one writer per symbol and timeframe
+    at a time; readers need no coordination.
+
+    Example:
+        files = BarFiles("/data/bars")
+        files.append("AAPL", "1min", fetch_columns(fmpsdk.historical_chart, ...))
+        bars = files.read("AAPL", "1min", start="2024-01-01", end="2024-06-30")
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self._lock = threading.Lock()
+
+    def _directory(self, symbol: str, timeframe: str) -> str:
+        for name in (symbol, timeframe):
+            if not name or name in (".", "..") or os.sep in name or "/" in name:
+                raise ValueError(f"Invalid symbol or timeframe: {name!r}")
+        return os.path.join(self.root, timeframe, symbol)
+
+    def _file(self, symbol: str, timeframe: str, column: str) -> str:
+        return os.path.join(self._directory(symbol, timeframe), f"{column}.bin")
+
+    def _length(self, symbol: str, timeframe: str) -> int:
+        # Complete bars: every column file must hold the bar.
+        lengths = []
+        for column, dtype in COLUMNS.items():
+            try:
+                size = os.path.getsize(self._file(symbol, timeframe, column))
+            except FileNotFoundError:
+                return 0
+            lengths.append(size // np.dtype(dtype).itemsize)
+        return min(lengths)
+
+    def symbols(self, timeframe: str) -> typing.List[str]:
+        """
+        :param timeframe: E.g. "1day" or a historical_chart time_delta.
+        :return: Every symbol stored for timeframe.
+        """
+        directory = os.path.join(self.root, timeframe)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(os.listdir(directory))
+
+    def last_timestamp(
+        self, symbol: str, timeframe: str
+    ) -> typing.Optional[np.datetime64]:
+        """
+        :param symbol: The ticker.
+        :param timeframe: E.g. "1day" or a historical_chart time_delta.
+        :return: Timestamp of the newest stored bar, or None if there is none.
+        """
+        timestamps = self.read(symbol, timeframe, columns=["timestamp"])["timestamp"]
+        return timestamps[-1] if len(timestamps) else None
+
+    def append(
+        self, symbol: str, timeframe: str, columns: typing.Dict[str, np.ndarray]
+    ) -> int:
+        """
+        Add bars newer than the last stored one.
+
+        :param symbol: The ticker.
+        :param timeframe: E.g. "1day" or a historical_chart time_delta.
+        :param columns: Column arrays as returned by fetch_columns(), in any order;
+            the bar time may be named "timestamp" or "date".  Missing prices are
+            NaN, missing volumes 0.
+        :return: Number of bars written.
+        """
+        timestamps = columns.get("timestamp", columns.get("date"))
+        if timestamps is None:
+            raise ValueError("columns needs a 'timestamp' or 'date' array.")
+        timestamps = np.asarray(timestamps, dtype=DATETIME)
+        keep = np.argsort(timestamps, kind="stable")
+        keep = keep[~np.isnat(timestamps[keep])]
+        # Several bars with one timestamp: keep the last one given.
+        ordered = timestamps[keep]
+        keep = keep[np.append(ordered[1:] != ordered[:-1], True)] if len(keep) else keep
+        with self._lock:
+            last = self.last_timestamp(symbol, timeframe)
+            if last is not None:
+                keep = keep[timestamps[keep] > last]
+            if not len(keep):
+                return 0
+            os.makedirs(self._directory(symbol, timeframe), exist_ok=True)
+            count = self._length(symbol, timeframe)
+            for column, dtype in reversed(COLUMNS.items()):
+                values = timestamps if column == "timestamp" else columns.get(column)
+                data = _column(values, dtype, len(timestamps))[keep]
+                with open(self._file(symbol, timeframe, column), "ab") as f:
+                    # Drop a partial bar left by an interrupted append.
+                    f.truncate(count * data.itemsize)
+                    data.astype(np.dtype(dtype).newbyteorder("<")).tofile(f)
+            return len(keep)
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: typing.Any = None,
+        end: typing.Any = None,
+        columns: typing.Optional[typing.Iterable[str]] = None,
+    ) -> typing.Dict[str, np.ndarray]:
+        """
+        Memory-map the stored bars between start and end (both inclusive).
+
+        The range is found by binary search on the timestamp column; the returned
+        arrays are read-only views of the files, so nothing is copied until used.
+        :param symbol: The ticker.
+        :param timeframe: E.g. "1day" or a historical_chart time_delta.
+        :param start: First timestamp, e.g. "2024-01-01" or a datetime64 (None = all).
+        :param end: Last timestamp; a date alone includes that whole day (None = all).
+        :param columns: Columns to map (default: all of COLUMNS).
+        :return: Dictionary of column name -> array.
+        """
+        names = list(COLUMNS) if columns is None else list(columns)
+        for name in names:
+            if name not in COLUMNS:
+                raise ValueError(
+                    f"Invalid column: {name}.  Valid options: {list(COLUMNS)}"
+                )
+        count = self._length(symbol, timeframe)
+        if count == 0:
+            return {name: np.empty(0, dtype=COLUMNS[name]) for name in names}
+        timestamps = self._map(symbol, timeframe, "timestamp", count)
+        first, stop = 0, count
+        if start is not None:
+            first = int(np.searchsorted(timestamps, _bound(start, False), "left"))
+        if end is not None:
+            stop = int(np.searchsorted(timestamps, _bound(end, True), "left"))
+        return {
+            name: self._map(symbol, timeframe, name, count)[first:stop]
+            for name in names
+        }
+
+    def _map(self, symbol: str, timeframe: str, column: str, count: int) -> np.ndarray:
+        dtype = np.dtype(COLUMNS[column]).newbyteorder("<")
+        return np.memmap(
+            self._file(symbol, timeframe, column), dtype=dtype, mode="r", shape=(count,)
+        )
+
+
+def _column(values: typing.Any, dtype: str, length: int) -> np.ndarray:
+    if values is None:
+        return (
+            np.zeros(length, dtype=dtype)
+            if dtype == "int64"
+            else np.full(length, np.nan)
+        )
+    values = np.asarray(values)
+    if dtype == "int64" and values.dtype.kind == "f":
+        values = np.nan_to_num(values, nan=0)
+    return values.astype(dtype)
+
+
+def _bound(value: typing.Any, end: bool) -> np.datetime64:
+    # The first timestamp after the range for end; a bare date covers its whole day.
+    if isinstance(value, str) and len(value) == 10 and end:
+        return np.datetime64(value, "D") + np.timedelta64(1, "D")
+    bound = np.datetime64(value, "s")
+    return bound + np.timedelta64(1, "s") if end else bound
@@ -0,0 +1,141 @@
+import functools
+import itertools
+import logging
+import math
+import typing
+
+from .concurrency import call_all
+from .settings import (
+    DEFAULT_BATCH_MAX_PATH_LENGTH,
+    DEFAULT_BATCH_MAX_SYMBOLS,
+    DEFAULT_MAX_WORKERS,
+)
+from .url_methods import __capture_split, _capturing
+
+
+class SymbolRows(list):
+    """
+    The rows of a chunked multi-symbol call (see fetch_chunked), a plain list.
+
+    Rows of the requested symbols come first, in the order of the request; rows the
+    server returned under other symbols (normalized tickers, aliases) or without a
+    symbol follow in the order received.  missing lists the requested symbols with
+    no row.
+    """
+
+    def __init__(
+        self,
+        rows: typing.Iterable[typing.Dict] = (),
+        missing: typing.Iterable[str] = (),
+    ):
+        super().__init__(rows)
+        self.missing: typing.List[str] = list(missing)
+
+
+def symbol_chunks(
+    symbols: typing.List[str],
+    max_symbols: int = DEFAULT_BATCH_MAX_SYMBOLS,
+    max_length: int = DEFAULT_BATCH_MAX_PATH_LENGTH,
+) -> typing.List[typing.List[str]]:
+    """
+    Split a symbol list into as few chunks as the server limits allow.
+
+    The chunks are balanced by URL length (a 450-symbol list with max_symbols=200
+    gives three chunks of about 150 rather than 200, 200 and 50), so parallel
+    requests finish at about the same time.
+    :param symbols: The tickers, in order.
+    :param max_symbols: Most symbols in one request.
+    :param max_length: Longest comma-joined symbol list in one URL path.
+    :return: A list of symbol lists, in order.
+    """
+    if not symbols:
+        return []
+    length = sum(len(symbol) + 1 for symbol in symbols)
+    count = max(
+        math.ceil(len(symbols) / max(1, max_symbols)),
+        math.ceil(length / max(1, max_length)),
+    )
+    # Balanced by length; each chunk aims for an equal share of what is left, and
+    # closes early rather than go over a limit.
+    chunks, chunk, chunk_length = [], [], 0
+    target = length / count
+    for symbol in symbols:
+        if chunk and (
+            len(chunk) >= max_symbols
+            or chunk_length + len(symbol) + 1 > max_length
+            or chunk_length >= target
+        ):
+            chunks.append(chunk)
+            length -= chunk_length
+            target = length / max(1, count - len(chunks))
+            chunk, chunk_length = [], 0
+        chunk.append(symbol)
+        chunk_length += len(symbol) + 1
+    chunks.append(chunk)
+    return chunks
+
+
+def fetch_chunked(
+    func: typing.Callable,
+    symbols: typing.List[str],
+    argument: str = "symbol",
+    max_symbols: int = DEFAULT_BATCH_MAX_SYMBOLS,
+    max_length: int = DEFAULT_BATCH_MAX_PATH_LENGTH,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs,
+) -> typing.Optional[typing.List[typing.Dict]]:
+    """
+    Call a multi-symbol endpoint function once per chunk, in parallel, and merge.
+
+    Rows come back in the order of symbols (repeated symbols are requested once),
+    followed by rows the server returned under other symbols, however many chunks
+    there are.  Symbols the server returned nothing for are logged and listed in the
+    result's missing attribute (see SymbolRows).  Like the endpoint functions, a failed chunk makes the
+    whole call return None; with request errors raised (see __call_raising), the
+    first error propagates.  While another front end captures the request (asyncio,
+    streaming, ...), the chunks are captured as one SplitRequest for it to send.
+    :param func: Function taking a list of symbols as argument that sends one request.
+    :param symbols: The tickers.
+    :param argument: Name of func's symbol list argument.
+    :param max_symbols: Most symbols in one request.
+    :param max_length: Longest comma-joined symbol list in one URL path.
+    :param max_workers: Maximum number of requests in flight.
+    :param kwargs: Other arguments for func.
+    :return: A SymbolRows list of dictionaries.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    chunks = symbol_chunks(symbols, max_symbols, max_length)
+    if not chunks:
+        return func(**{argument: symbols}, **kwargs)
+    calls = [dict(kwargs, **{argument: chunk}) for chunk in chunks]
+    merge = functools.partial(_merge_chunks, symbols=symbols)
+    if _capturing.get():
+        # Chunks never overlap: the streaming front end keeps every row.
+        return __capture_split(func, calls, merge, None)
+    if len(calls) == 1:
+        return merge([func(**calls[0])])
+    return merge(call_all(func, calls, max_workers))
+
+
+def _symbol_key(row: typing.Any) -> typing.Optional[str]:
+    symbol = row.get("symbol") if isinstance(row, dict) else None
+    return None if symbol is None else str(symbol).upper()
+
+
+def _merge_chunks(
+    results: typing.List, symbols: typing.List[str]
+) -> typing.Optional[SymbolRows]:
+    if any(result is None for result in results):
+        return None
+    requested = {symbol.upper(): [] for symbol in symbols}
+    others = []
+    for result in results:
+        if not isinstance(result, list):
+            return result  # An error message, not rows.
+        for row in result:
+            requested.get(_symbol_key(row), others).append(row)
+    missing = [s for s in symbols if not requested[s.upper()]]
+    if missing:
+        logging.warning(f"No data returned for {len(missing)} symbol(s): {missing}")
+    merged = itertools.chain.from_iterable(requested.values())
+    return SymbolRows(itertools.chain(merged, others), missing)
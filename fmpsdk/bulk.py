@@ -3,6 +3,7 @@ import typing
 
 import requests
 
+from .batching import fetch_chunked
 from .general import __quotes
 from .settings import DEFAULT_LIMIT, BASE_URL_v3, BASE_URL_v4
 from .url_methods import __return_json_v3, __return_json_v4, __return_json_stable
@@ -38,7 +39,7 @@ def bulk_profiles(apikey: str, part: str) -> typing.Optional[typing.List[typing.
     :return: A list of dictionaries.
     """
     path = f"profile-bulk"
-    query_vars = {"apikey": apikey, "part": part}
+    query_vars = {"apikey": apikey, "part": part, "datatype": "csv"}
     return __return_json_stable(path=path, query_vars=query_vars)
 
 
@@ -53,6 +54,9 @@ def batch_quote(
     Endpoint:
         https://financialmodelingprep.com/api/v4/batch-pre-post-market/{symbol}
 
+    Long symbol lists are split into several requests (see batching.symbol_chunks)
+    that run in parallel; the rows come back in the order of the list.
+
     :param apikey: Your API key.
     :param symbols: List of stock symbols to get quotes for.
     :return: A list of dictionaries containing quote data for each symbol.
@@ -61,6 +65,19 @@ def batch_quote(
         logging.warning("No symbols provided for batch quote request.")
         return []
     
+    return fetch_chunked(__batch_quote, symbols, argument="symbols", apikey=apikey)
+
+
+def __batch_quote(
+    apikey: str, symbols: typing.List[str]
+) -> typing.Optional[typing.List[typing.Dict]]:
+    """
+    Get real-time quotes for one list of symbols.
+
+    :param apikey: Your API key.
+    :param symbols: List of stock symbols to get quotes for.
+    :return: A list of dictionaries containing quote data for each symbol.
+    """
     path = f"batch-pre-post-market/{','.join(symbols)}"
     query_vars = {"apikey": apikey}
     return __return_json_v4(path=path, query_vars=query_vars)
@@ -0,0 +1,161 @@
+import collections
+import threading
+import time
+import typing
+import urllib.parse
+
+from .context import current_client, default_client
+from .settings import CACHE_TTLS, DEFAULT_CACHE_MAX_BYTES
+
+MISS = object()
+
+
+def cache_key(base_url: str, path: str, query_vars: typing.Dict) -> str:
+    """
+    Build a cache key that is the same for every equivalent request.
+
+    The apikey is left out and the query values are sorted, so the key does not
+    depend on who asked or in which order the query was built.
+    :param base_url: One of the BASE_URL_* values from settings.
+    :param path: Path after TLD of URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :return: The key.
+    """
+    query = sorted(
+        (key, str(value))
+        for key, value in query_vars.items()
+        if key != "apikey" and value is not None
+    )
+    return f"{base_url}{path}?{urllib.parse.urlencode(query)}"
+
+
+def prefix_ttl(ttls: typing.Dict[str, float], path: str, default: float) -> float:
+    """
+    Find the TTL of the longest path prefix in ttls that matches path.
+
+    :param ttls: TTL in seconds by endpoint path prefix.
+    :param path: Path after TLD of URL
+    :param default: TTL when no prefix matches.
+    :return: TTL in seconds.
+    """
+    best = None
+    for prefix in ttls:
+        if path.startswith(prefix) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return ttls[best] if best is not None else default
+
+
+class MemoryCache:
+    """
+    In-process response cache with per-endpoint TTLs and LRU eviction.
+
+    The size of an entry is the size of the response body it was parsed from; the
+    least recently used entries are dropped once max_bytes is exceeded.  Cached values
+    are shared between callers, so copy a result before modifying it.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        ttls: typing.Optional[typing.Dict[str, float]] = None,
+        default_ttl: float = 0,
+    ):
+        self.max_bytes = max_bytes
+        self.ttls = dict(CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        # key -> (value, size, expiry on the monotonic clock), oldest use first.
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Return how long responses for an endpoint may be cached.
+
+        :param path: Path after TLD of URL
+        :return: TTL in seconds, 0 when the endpoint is not cached.
+        """
+        return prefix_ttl(self.ttls, path, self.default_ttl)
+
+    def get(self, key: str) -> typing.Any:
+        """
+        Look a value up.
+
+        :param key: Key built by cache_key().
+        :return: The cached value, or MISS.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] < time.monotonic():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: typing.Any, size: int, ttl: float) -> None:
+        """
+        Store a value.
+
+        :param key: Key built by cache_key().
+        :param value: Parsed response.
+        :param size: Size in bytes of the response body.
+        :param ttl: Lifetime in seconds.
+        :return: None
+        """
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, size, time.monotonic() + ttl)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key)[1]
+
+
+def configure_cache(
+    enabled: bool = True,
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ttls: typing.Optional[typing.Dict[str, float]] = None,
+    default_ttl: float = 0,
+) -> typing.Optional[MemoryCache]:
+    """
+    Turn the in-memory response cache on or off.
+
+    :param enabled: False removes the cache.
+    :param max_bytes: Upper bound on the total size of cached response bodies.
+    :param ttls: TTL in seconds by endpoint path prefix.  Defaults to
+        settings.CACHE_TTLS, which covers the daily reference lists.
+    :param default_ttl: TTL for endpoints not matched by ttls (0 = not cached).
+    :return: The new cache, or None if caching was turned off.
+    """
+    cache = (
+        MemoryCache(max_bytes=max_bytes, ttls=ttls, default_ttl=default_ttl)
+        if enabled
+        else None
+    )
+    default_client().cache = cache
+    return cache
+
+
+def get_cache() -> typing.Optional[MemoryCache]:
+    """
+    Return the response cache of the active FMPClient, or None if caching is off.
+
+    :return: The MemoryCache or None.
+    """
+    return current_client().cache
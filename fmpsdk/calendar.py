@@ -1,23 +1,48 @@
 import typing
 import logging
 
-from .settings import DEFAULT_LIMIT
+from .ranges import fetch_range, row_identity
+from .settings import CALENDAR_WINDOW_DAYS, DEFAULT_LIMIT
 from .url_methods import __return_json_v3, __return_json_v4, __return_json_stable
 
 
-def earning_calendar(
-    apikey: str, from_date: str = None, to_date: str = None
+def __calendar_range(
+    path: str, apikey: str, from_date: str = None, to_date: str = None
 ) -> typing.Optional[typing.List[typing.Dict]]:
     """
-    Query FMP /earnings-calendar/ API.
+    Query a calendar API, one window of at most CALENDAR_WINDOW_DAYS at a time.
 
-    Note: Between the "from" and "to" parameters the maximum time interval can be 3 months.
+    :param path: Path after TLD of URL
+    :param apikey: Your API key.
+    :param from_date: 'YYYY-MM-DD'
+    :param to_date: 'YYYY-MM-DD'
+    :return: A list of dictionaries, newest first.
+    """
+    return fetch_range(
+        __calendar,
+        from_date=from_date,
+        to_date=to_date,
+        days=CALENDAR_WINDOW_DAYS,
+        key=row_identity,
+        sort_key=lambda row: row.get("date") or "",
+        newest_first=True,
+        path=path,
+        apikey=apikey,
+    )
+
+
+def __calendar(
+    path: str, apikey: str, from_date: str = None, to_date: str = None
+) -> typing.Optional[typing.List[typing.Dict]]:
+    """
+    Query a calendar API for one window.
+
+    :param path: Path after TLD of URL
     :param apikey: Your API key.
     :param from_date: 'YYYY-MM-DD'
     :param to_date: 'YYYY-MM-DD'
     :return: A list of dictionaries.
     """
-    path = f"earnings-calendar"
     query_vars = {
         "apikey": apikey,
     }
@@ -28,6 +53,25 @@ def earning_calendar(
     return __return_json_stable(path=path, query_vars=query_vars)
 
 
+def earning_calendar(
+    apikey: str, from_date: str = None, to_date: str = None
+) -> typing.Optional[typing.List[typing.Dict]]:
+    """
+    Query FMP /earnings-calendar/ API.
+
+    Note: Between the "from" and "to" parameters the maximum time interval can be 3 months.
+    Longer ranges are split into windows that are fetched in parallel and merged.
+    :param apikey: Your API key.
+    :param from_date: 'YYYY-MM-DD'
+    :param to_date: 'YYYY-MM-DD'
+    :return: A list of dictionaries.
+    """
+    path = f"earnings-calendar"
+    return __calendar_range(
+        path=path, apikey=apikey, from_date=from_date, to_date=to_date
+    )
+
+
 def historical_earning_calendar(
     apikey: str, symbol: str, limit: int = DEFAULT_LIMIT
 ) -> typing.Optional[typing.List[typing.Dict]]:
@@ -56,20 +100,16 @@ def ipo_calendar(
     Query FMP /ipos-calendar/ API.
 
     Note: Between the "from" and "to" parameters the maximum time interval can be 3 months.
+    Longer ranges are split into windows that are fetched in parallel and merged.
     :param apikey: Your API key.
     :param from_date: 'YYYY-MM-DD'
     :param to_date: 'YYYY-MM-DD'
     :return: A list of dictionaries.
     """
     path = f"ipos-calendar"
-    query_vars = {
-        "apikey": apikey,
-    }
-    if from_date:
-        query_vars["from"] = from_date
-    if to_date:
-        query_vars["to"] = to_date
-    return __return_json_stable(path=path, query_vars=query_vars)
+    return __calendar_range(
+        path=path, apikey=apikey, from_date=from_date, to_date=to_date
+    )
 
 
 def stock_split_calendar(
@@ -79,20 +119,16 @@ def stock_split_calendar(
     Query FMP /splits-calendar/ API.
 
     Note: Between the "from" and "to" parameters the maximum time interval can be 3 months.
+    Longer ranges are split into windows that are fetched in parallel and merged.
     :param apikey: Your API key.
     :param from_date: 'YYYY-MM-DD'
     :param to_date: 'YYYY-MM-DD'
     :return: A list of dictionaries.
     """
     path = f"splits-calendar"
-    query_vars = {
-        "apikey": apikey,
-    }
-    if from_date:
-        query_vars["from"] = from_date
-    if to_date:
-        query_vars["to"] = to_date
-    return __return_json_stable(path=path, query_vars=query_vars)
+    return __calendar_range(
+        path=path, apikey=apikey, from_date=from_date, to_date=to_date
+    )
 
 
 def dividend_calendar(
@@ -102,21 +138,16 @@ def dividend_calendar(
     Query FMP /dividends-calendar/ API.
 
     Note: Between the "from" and "to" parameters the maximum time interval can be 3 months.
+    Longer ranges are split into windows that are fetched in parallel and merged.
     :param apikey: Your API key.
     :param from_date: 'YYYY-MM-DD'
     :param to_date: 'YYYY-MM-DD'
     :return: A list of dictionaries.
     """
     path = f"dividends-calendar"
-    query_vars = {
-        "apikey": apikey,
-    }
-    if from_date:
-        query_vars["from"] = from_date
-    if to_date:
-        query_vars["to"] = to_date
-
-    return __return_json_stable(path=path, query_vars=query_vars)
+    return __calendar_range(
+        path=path, apikey=apikey, from_date=from_date, to_date=to_date
+    )
 
 
 def economic_calendar(
@@ -126,20 +157,16 @@ def economic_calendar(
     Query FMP /economic-calendar/ API.
 
     Note: Between the "from" and "to" parameters the maximum time interval can be 3 months.
+    Longer ranges are split into windows that are fetched in parallel and merged.
     :param apikey: Your API key.
     :param from_date: 'YYYY-MM-DD'
     :param to_date: 'YYYY-MM-DD'
     :return: A list of dictionaries.
     """
     path = f"economic-calendar"
-    query_vars = {
-        "apikey": apikey,
-    }
-    if from_date:
-        query_vars["from"] = from_date
-    if to_date:
-        query_vars["to"] = to_date
-    return __return_json_stable(path=path, query_vars=query_vars)
+    return __calendar_range(
+        path=path, apikey=apikey, from_date=from_date, to_date=to_date
+    )
 
 
 def earning_calendar_confirmed(
@@ -0,0 +1,207 @@
+import contextlib
+import functools
+import os
+import threading
+import typing
+
+import requests
+
+from .cache import MemoryCache
+from .context import _active_client
+from .disk_cache import DiskCache
+from .endpoints import endpoint_functions
+from .rate_limit import TokenBucket
+from .records import RECORD_TYPES, to_objects
+from .retry import RetryPolicy
+from .session import new_session
+from .settings import (
+    DEFAULT_POOL_BLOCK,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+)
+
+OUTPUT_FORMATS: typing.List[str] = ["records", "dataframe", "objects"]
+
+
+class FMPClient:
+    """
+    A self-contained fmpsdk configuration with every endpoint as a method.
+
+    The client owns its API key, connection pool, timeouts, retry policies, caches and
+    rate limiter, so several clients (e.g. one per API key) can be used side by side:
+
+        client = FMPClient(apikey=apikey, rate_limiter=TokenBucket(300))
+        client.quote(symbol="AAPL")
+
+    Methods take the same arguments as the module-level functions, minus apikey.  The
+    module-level functions run on a default client, which the configure_*() functions
+    set up.
+    """
+
+    def __init__(
+        self,
+        apikey: typing.Optional[str] = None,
+        connect_timeout: typing.Optional[float] = None,
+        read_timeout: typing.Optional[float] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = DEFAULT_POOL_BLOCK,
+        retry: typing.Union[RetryPolicy, typing.Dict[str, RetryPolicy], None] = None,
+        rate_limiter: typing.Optional[TokenBucket] = None,
+        cache: typing.Optional[MemoryCache] = None,
+        disk_cache: typing.Optional[DiskCache] = None,
+        output: str = "records",
+    ):
+        """
+        :param apikey: Your API key, passed to every method.
+        :param connect_timeout: Seconds to wait for a connection.  None uses
+            url_methods.CONNECT_TIMEOUT.
+        :param read_timeout: Seconds to wait for data.  None uses
+            url_methods.READ_TIMEOUT.
+        :param pool_connections: Number of per-host connection pools to keep.
+        :param pool_maxsize: Maximum number of connections kept open per host.
+        :param pool_block: True to block when the pool for a host is exhausted.
+        :param retry: A RetryPolicy for every endpoint, or policies by family (see
+            configure_retry()).
+        :param rate_limiter: Paces the requests of this client; share one TokenBucket
+            between clients that share a plan limit.
+        :param cache: In-memory response cache.
+        :param disk_cache: SQLite response cache.
+        :param output: "records" returns results as the module-level functions do;
+            "dataframe" returns pandas DataFrames with typed columns (see
+            frames.to_frame(); requires pandas); "objects" returns quotes and bars
+            as compact record objects (see records.RECORD_TYPES).
+        """
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Invalid output value: {output}.  Valid options: {OUTPUT_FORMATS}"
+            )
+        self.apikey = apikey
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry_policies: typing.Dict[str, RetryPolicy] = {"default": RetryPolicy()}
+        if isinstance(retry, RetryPolicy):
+            self.retry_policies["default"] = retry
+        elif retry:
+            self.retry_policies.update(retry)
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.output = output
+        self._pool_config = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+        }
+        self._session: typing.Optional[requests.Session] = None
+        self._session_pid: typing.Optional[int] = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The requests.Session of this client, created on first use.
+
+        It is safe to share between threads.  A forked child builds its own, since
+        sockets must never be shared with the parent.
+        """
+        pid = os.getpid()
+        if self._session is None or self._session_pid != pid:
+            with self._session_lock:
+                if self._session is None or self._session_pid != pid:
+                    self._session = new_session(**self._pool_config)
+                    self._session_pid = pid
+        return self._session
+
+    def configure_session(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = DEFAULT_POOL_BLOCK,
+    ) -> None:
+        """
+        Change the connection pool settings.
+
+        The current session (if any) is closed and a new one is built on next use.
+        :param pool_connections: Number of per-host connection pools to keep.
+        :param pool_maxsize: Maximum number of connections kept open per host.
+        :param pool_block: True to block when the pool for a host is exhausted.
+        :return: None
+        """
+        self._pool_config = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+        }
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the session and release its pooled connections.
+
+        :return: None
+        """
+        with self._session_lock:
+            if self._session is not None and self._session_pid == os.getpid():
+                self._session.close()
+            self._session = None
+            self._session_pid = None
+
+    def __enter__(self) -> "FMPClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextlib.contextmanager
+    def activate(self) -> typing.Iterator["FMPClient"]:
+        """
+        Apply this client's configuration to module-level calls made in the block.
+
+        Useful with helpers that take an endpoint function, e.g. iter_rows():
+
+            with client.activate():
+                for row in iter_rows(fmpsdk.symbols_list, apikey=client.apikey):
+                    ...
+        """
+        token = _active_client.set(self)
+        try:
+            yield self
+        finally:
+            _active_client.reset(token)
+
+    def __getattr__(self, name: str) -> typing.Callable:
+        # Only called for attributes not found normally: endpoint methods are bound on
+        # first use and then stored on the instance.
+        func = endpoint_functions().get(name)
+        if func is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        method = self._bind(func)
+        self.__dict__[name] = method
+        return method
+
+    def __dir__(self) -> typing.List[str]:
+        return sorted(set(super().__dir__()) | set(endpoint_functions()))
+
+    def _bind(self, func: typing.Callable) -> typing.Callable:
+        @functools.wraps(func)
+        def method(*args, **kwargs):
+            if "apikey" not in kwargs:
+                args = (self.apikey,) + args
+            token = _active_client.set(self)
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _active_client.reset(token)
+            if self.output == "dataframe":
+                # Imported on demand: pandas is optional.
+                from .frames import to_frame
+
+                return to_frame(result)
+            if self.output == "objects" and func.__name__ in RECORD_TYPES:
+                return to_objects(result, RECORD_TYPES[func.__name__])
+            return result
+
+        return method
@@ -0,0 +1,173 @@
+import csv
+import datetime
+import io
+import itertools
+import logging
+import typing
+
+from .settings import DEFAULT_STREAM_BATCH_SIZE
+
+# Column types of datatype=csv responses, by endpoint path prefix.  Columns not listed
+# stay text.
+CSV_SCHEMAS: typing.Dict[str, typing.Dict[str, str]] = {
+    "profile-bulk": {
+        "price": "float",
+        "marketCap": "float",
+        "beta": "float",
+        "lastDividend": "float",
+        "change": "float",
+        "changePercentage": "float",
+        "volume": "int",
+        "averageVolume": "int",
+        "fullTimeEmployees": "int",
+        "ipoDate": "date",
+        "defaultImage": "bool",
+        "isEtf": "bool",
+        "isActivelyTrading": "bool",
+        "isAdr": "bool",
+        "isFund": "bool",
+    },
+    "upgrades-downgrades-consensus-bulk": {
+        "strongBuy": "int",
+        "buy": "int",
+        "hold": "int",
+        "sell": "int",
+        "strongSell": "int",
+    },
+}
+
+# Cell values that mean "no value".
+NULLS = frozenset({"", "None", "null", "NULL"})
+
+_BOOLEANS = {"true": True, "false": False, "True": True, "False": False}
+
+
+def csv_records(text: str, path: str) -> typing.List[typing.Dict]:
+    """
+    Parse a datatype=csv response into a list of dictionaries with typed values.
+
+    :param text: The decoded response body.
+    :param path: Endpoint path, used to find the column schema.
+    :return: A list of dictionaries.
+    """
+    records = []
+    batches = csv_column_batches(io.StringIO(text), path, DEFAULT_STREAM_BATCH_SIZE)
+    for columns in batches:
+        records.extend(column_records(columns))
+    return records
+
+
+def csv_column_batches(
+    lines: typing.Iterable[str], path: str, batch_size: typing.Optional[int] = None
+) -> typing.Iterator[typing.Dict[str, list]]:
+    """
+    Parse CSV lines into batches of typed columns.
+
+    Each batch is converted a column at a time (see coerce_columns), which is several
+    times faster than converting row dictionaries cell by cell.
+    :param lines: Lines of the CSV document, header first.
+    :param path: Endpoint path, used to find the column schema.
+    :param batch_size: Rows per batch; None for a single batch.
+    :return: An iterator of dictionaries of column name -> list of values.
+    """
+    # Blank lines come out as [], which csv.DictReader skipped too.
+    reader = filter(None, csv.reader(lines))
+    header = next(reader, None)
+    if header is None:
+        return
+    while True:
+        batch = list(itertools.islice(reader, batch_size))
+        if not batch:
+            return
+        # Short rows are padded with None like csv.DictReader does; zip() drops
+        # fields beyond the header.
+        columns = list(map(list, itertools.zip_longest(*batch)))
+        columns.extend([None] * len(batch) for _ in range(len(header) - len(columns)))
+        yield coerce_columns(dict(zip(header, columns)), path)
+        if batch_size is None:
+            return
+
+
+def coerce_columns(
+    columns: typing.Dict[str, list], path: str
+) -> typing.Dict[str, list]:
+    """
+    Convert text columns to the types in CSV_SCHEMAS, in place.
+
+    NULLS become None in every column.
+    :param columns: Dictionary of column name -> list of strings.
+    :param path: Endpoint path, used to find the column schema.
+    :return: columns
+    """
+    schema = next(
+        (schema for prefix, schema in CSV_SCHEMAS.items() if path.startswith(prefix)),
+        {},
+    )
+    for name, values in columns.items():
+        columns[name] = _coerce(values, schema.get(name, "str"), name)
+    return columns
+
+
+def column_records(columns: typing.Dict[str, list]) -> typing.List[typing.Dict]:
+    """
+    Turn a dictionary of columns back into a list of row dictionaries.
+
+    :param columns: Dictionary of column name -> list of values.
+    :return: A list of dictionaries.
+    """
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+def _coerce(values: list, kind: str, name: str) -> list:
+    if kind in _CONVERTERS:
+        fast, convert = _CONVERTERS[kind]
+        try:
+            return list(map(fast, values))  # No missing or odd values.
+        except (TypeError, ValueError):
+            pass
+        converted, failed = [], False
+        for v in values:
+            if v is None or v in NULLS:
+                converted.append(None)
+                continue
+            try:
+                converted.append(convert(v))
+            except ValueError:
+                converted.append(None)
+                failed = True
+        if failed:
+            logging.warning(f"Unexpected {kind} values in column {name} set to None.")
+        return converted
+    if kind == "bool":
+        return [_BOOLEANS.get(v) for v in values]
+    if NULLS.isdisjoint(values):
+        return values
+    return [None if v in NULLS else v for v in values]
+
+
+def to_int(value: typing.Any) -> typing.Optional[int]:
+    """
+    Convert an API value to int, accepting float notation.
+
+    :param value: A number or its text; None and "" mean no value.
+    :return: The int, or None.
+    """
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return int(float(value))  # "1.2E7" or "123.0"
+
+
+def _date(value: str) -> datetime.date:
+    return datetime.date.fromisoformat(value[:10])
+
+
+# kind -> (converter for the common case, converter for every value)
+_CONVERTERS: typing.Dict[str, typing.Tuple[typing.Callable, typing.Callable]] = {
+    "float": (float, float),
+    "int": (int, to_int),
+    "date": (_date, _date),
+}
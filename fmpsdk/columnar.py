@@ -0,0 +1,197 @@
+"""
+Price history as NumPy column arrays instead of lists of dictionaries.
+
+fetch_columns() returns one contiguous array per field (datetime64 dates, float64
+prices, int64 volumes), filled straight from the response body, so long histories
+cost a few arrays rather than a dictionary per bar.
+
+Requires numpy: ``pip install fmpsdk[numpy]``.
+"""
+
+import csv
+import io
+import itertools
+import json
+import typing
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "fmpsdk.columnar requires numpy.  Install it with 'pip install fmpsdk[numpy]'."
+    ) from e
+
+from .concurrency import call_all
+from .url_methods import PreparedRequest, SplitRequest, __capture_request, __send
+
+DATETIME = "datetime64[s]"
+
+# Columns and dtypes by endpoint path prefix.  Fields missing from a response are
+# NaN/NaT; fields not listed are dropped.
+BAR_SCHEMAS: typing.Dict[str, typing.Dict[str, str]] = {
+    "historical-price-full": {
+        "symbol": "str",
+        "date": DATETIME,
+        "open": "float64",
+        "high": "float64",
+        "low": "float64",
+        "close": "float64",
+        "adjClose": "float64",
+        "volume": "int64",
+        "unadjustedVolume": "int64",
+        "change": "float64",
+        "changePercent": "float64",
+        "vwap": "float64",
+        "changeOverTime": "float64",
+    },
+    "historical-chart": {
+        "date": DATETIME,
+        "open": "float64",
+        "high": "float64",
+        "low": "float64",
+        "close": "float64",
+        "volume": "int64",
+    },
+    "batch-historical-eod": {
+        "symbol": "str",
+        "date": DATETIME,
+        "open": "float64",
+        "high": "float64",
+        "low": "float64",
+        "close": "float64",
+        "adjClose": "float64",
+        "volume": "int64",
+    },
+}
+
+
+def fetch_columns(
+    func: typing.Callable, *args, **kwargs
+) -> typing.Dict[str, np.ndarray]:
+    """
+    Call a price history endpoint and return its bars as column arrays.
+
+    Supported: historical_price_full, historical_chart and bulk_historical_eod.  All
+    arrays have the same length; integer columns with missing values come back as
+    float64 with NaN.  Several symbols in one historical_price_full call are
+    concatenated, with their ticker in the "symbol" column, and long historical_chart
+    ranges are fetched window by window in parallel.  Rate limiting and
+    retries apply as usual; the response cache is bypassed.  Request errors are
+    raised (HTTP errors as requests.HTTPError).
+
+    Example:
+        bars = fetch_columns(fmpsdk.historical_price_full, apikey=apikey, symbol="AAPL")
+        returns = np.diff(np.log(bars["close"]))
+    :param func: An fmpsdk endpoint function.
+    :param args: Arguments for func.
+    :param kwargs: Arguments for func.
+    :return: Dictionary of column name -> numpy array.
+    """
+    request, result = __capture_request(func, *args, **kwargs)
+    if request is None:
+        return {}
+    schema = next(
+        (
+            schema
+            for prefix, schema in BAR_SCHEMAS.items()
+            if request.path.startswith(prefix)
+        ),
+        None,
+    )
+    if schema is None or request.filename is not None:
+        raise ValueError(
+            f"Columnar output is not available for {request.path}.  Supported: "
+            f"{list(BAR_SCHEMAS.keys())}"
+        )
+    if not isinstance(request, SplitRequest):
+        columns = _fetch_columns(request, schema)
+    else:
+        # A long range in several windows: concatenate them in order, without the
+        # bars that two windows both returned.
+        parts = call_all(
+            _fetch_columns, [{"request": r, "schema": schema} for r in request.requests]
+        )
+        columns = {name: [] for name in schema}
+        seen = set()
+        for part in parts:
+            keys = zip(part.get("symbol") or itertools.repeat(None), part["date"])
+            for i, bar_key in enumerate(keys):
+                if bar_key in seen:
+                    continue
+                seen.add(bar_key)
+                for name, column in columns.items():
+                    column.append(part[name][i])
+    return {name: _array(columns[name], dtype) for name, dtype in schema.items()}
+
+
+def _fetch_columns(
+    request: PreparedRequest, schema: typing.Dict[str, str]
+) -> typing.Dict[str, list]:
+    response = __send(request.base_url, request.path, request.query_vars)
+    response.raise_for_status()
+    if request.query_vars.get("datatype") == "csv":
+        return _csv_columns(response.content, schema)
+    return _json_columns(response.content, schema)
+
+
+def _csv_columns(
+    content: bytes, schema: typing.Dict[str, str]
+) -> typing.Dict[str, list]:
+    columns = {name: [] for name in schema}
+    reader = csv.reader(io.StringIO(content.decode("utf-8-sig")))
+    header = next(reader, [])
+    positions = [
+        (columns[name], header.index(name) if name in header else None)
+        for name in schema
+    ]
+    for fields in reader:
+        for column, i in positions:
+            column.append(fields[i] if i is not None and i < len(fields) else None)
+    return columns
+
+
+def _json_columns(
+    content: bytes, schema: typing.Dict[str, str]
+) -> typing.Dict[str, list]:
+    columns = {name: [] for name in schema}
+
+    def append_bar(pairs: typing.List[typing.Tuple[str, typing.Any]]) -> typing.Any:
+        # Called by the decoder for every object, innermost first.  Bars (objects
+        # with a date) go straight into the columns; wrappers are kept whole.
+        row = dict(pairs)
+        if "date" not in row:
+            return row
+        for name, column in columns.items():
+            column.append(row.get(name))
+        return None
+
+    document = json.loads(content, object_pairs_hook=append_bar) if content else []
+    if "symbol" in columns and not any(v is not None for v in columns["symbol"]):
+        # historical-price-full puts the ticker on the wrapper, not on each bar.
+        if isinstance(document, dict):
+            document = document.get("historicalStockList", [document])
+        symbols = []
+        for wrapper in document if isinstance(document, list) else []:
+            if isinstance(wrapper, dict):
+                bars = wrapper.get("historical") or []
+                symbols.extend([wrapper.get("symbol")] * len(bars))
+        if len(symbols) == len(columns["date"]):
+            columns["symbol"] = symbols
+    return columns
+
+
+def _array(values: list, dtype: str) -> np.ndarray:
+    if dtype == DATETIME:
+        return np.array(values, dtype=DATETIME)  # None and "" become NaT.
+    if dtype == "str":
+        return np.array(["" if v is None else v for v in values], dtype=str)
+    try:
+        return np.array(values, dtype=dtype)
+    except (TypeError, ValueError):
+        # Missing values (None, "") or integers written as "123.0".
+        floats = np.array(
+            [np.nan if v is None or v == "" else v for v in values], dtype="float64"
+        )
+        if dtype == "int64" and not np.isnan(floats).any():
+            return floats.astype("int64")
+        return floats
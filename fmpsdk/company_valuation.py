@@ -1,8 +1,6 @@
 import logging
 import typing
 
-import requests
-
 from .settings import (
     BALANCE_SHEET_STATEMENT_AS_REPORTED_FILENAME,
     BALANCE_SHEET_STATEMENT_FILENAME,
@@ -12,9 +10,9 @@ from .settings import (
     FINANCIAL_STATEMENT_FILENAME,
     INCOME_STATEMENT_AS_REPORTED_FILENAME,
     INCOME_STATEMENT_FILENAME,
-    BASE_URL_v3,
 )
 from .url_methods import (
+    __download_v3,
     __return_json_v3,
     __return_json_v4,
     __return_json_stable,
@@ -119,9 +117,8 @@ def financial_statement(
         "apikey": apikey,
         "datatype": "zip",  # Only ZIP format is supported.
     }
-    response = requests.get(f"{BASE_URL_v3}{path}", params=query_vars)
-    open(filename, "wb").write(response.content)
-    logging.info(f"Saving {symbol} financial statement as {filename}.")
+    if __download_v3(path=path, query_vars=query_vars, filename=filename):
+        logging.info(f"Saving {symbol} financial statement as {filename}.")
 
 
 def income_statement(
@@ -148,9 +145,8 @@ def income_statement(
     query_vars = {"apikey": apikey, "limit": limit, "period": __validate_period(period)}
     if download:
         query_vars["datatype"] = "csv"  # Only CSV is supported.
-        response = requests.get(f"{BASE_URL_v3}{path}", params=query_vars)
-        open(filename, "wb").write(response.content)
-        logging.info(f"Saving {symbol} financial statement as {filename}.")
+        if __download_v3(path=path, query_vars=query_vars, filename=filename):
+            logging.info(f"Saving {symbol} financial statement as {filename}.")
     else:
         return __return_json_v3(path=path, query_vars=query_vars)
 
@@ -179,9 +175,8 @@ def balance_sheet_statement(
     query_vars = {"apikey": apikey, "limit": limit, "period": __validate_period(period)}
     if download:
         query_vars["datatype"] = "csv"  # Only CSV is supported.
-        response = requests.get(f"{BASE_URL_v3}{path}", params=query_vars)
-        open(filename, "wb").write(response.content)
-        logging.info(f"Saving {symbol} financial statement as {filename}.")
+        if __download_v3(path=path, query_vars=query_vars, filename=filename):
+            logging.info(f"Saving {symbol} financial statement as {filename}.")
     else:
         return __return_json_v3(path=path, query_vars=query_vars)
 
@@ -210,9 +205,8 @@ def cash_flow_statement(
     query_vars = {"apikey": apikey, "limit": limit, "period": __validate_period(period)}
     if download:
         query_vars["datatype"] = "csv"  # Only CSV is supported.
-        response = requests.get(f"{BASE_URL_v3}{path}", params=query_vars)
-        open(filename, "wb").write(response.content)
-        logging.info(f"Saving {symbol} financial statement as {filename}.")
+        if __download_v3(path=path, query_vars=query_vars, filename=filename):
+            logging.info(f"Saving {symbol} financial statement as {filename}.")
     else:
         return __return_json_v3(path=path, query_vars=query_vars)
 
@@ -322,9 +316,8 @@ def income_statement_as_reported(
     }
     if download:
         query_vars["datatype"] = "csv"  # Only CSV is supported.
-        response = requests.get(f"{BASE_URL_v3}{path}", params=query_vars)
-        open(filename, "wb").write(response.content)
-        logging.info(f"Saving {symbol} financial statement as {filename}.")
+        if __download_v3(path=path, query_vars=query_vars, filename=filename):
+            logging.info(f"Saving {symbol} financial statement as {filename}.")
     else:
         return __return_json_v3(path=path, query_vars=query_vars)
 
@@ -357,9 +350,8 @@ def balance_sheet_statement_as_reported(
     }
     if download:
         query_vars["datatype"] = "csv"  # Only CSV is supported.
-        response = requests.get(f"{BASE_URL_v3}{path}", params=query_vars)
-        open(filename, "wb").write(response.content)
-        logging.info(f"Saving {symbol} financial statement as {filename}.")
+        if __download_v3(path=path, query_vars=query_vars, filename=filename):
+            logging.info(f"Saving {symbol} financial statement as {filename}.")
     else:
         return __return_json_v3(path=path, query_vars=query_vars)
 
@@ -392,9 +384,8 @@ def cash_flow_statement_as_reported(
     }
     if download:
         query_vars["datatype"] = "csv"  # Only CSV is supported.
-        response = requests.get(f"{BASE_URL_v3}{path}", params=query_vars)
-        open(filename, "wb").write(response.content)
-        logging.info(f"Saving {symbol} financial statement as {filename}.")
+        if __download_v3(path=path, query_vars=query_vars, filename=filename):
+            logging.info(f"Saving {symbol} financial statement as {filename}.")
     else:
         return __return_json_v3(path=path, query_vars=query_vars)
 
@@ -0,0 +1,129 @@
+import collections
+import concurrent.futures
+import contextvars
+import typing
+
+from .settings import DEFAULT_MAX_WORKERS
+from .url_methods import __call_raising
+
+
+class FetchResult(typing.NamedTuple):
+    """Outcome of one endpoint call made by fetch_many()."""
+
+    symbol: str
+    value: typing.Any = None
+    error: typing.Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def fetch_many(
+    func: typing.Callable,
+    symbols: typing.Iterable[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    ordered: bool = True,
+    **kwargs,
+) -> typing.Iterator[FetchResult]:
+    """
+    Call one endpoint function for many symbols using a bounded pool of threads.
+
+    Results are yielded as they become available, so work on the first symbols can
+    start while the rest are still being downloaded.  A failing symbol does not stop
+    the run; its FetchResult carries the exception (e.g. requests.HTTPError for a
+    429 or 404) instead of a value.
+
+    Example:
+        for r in fetch_many(fmpsdk.company_profile, symbols, apikey=apikey):
+            if r.ok:
+                ...
+
+    Size the shared connection pool to match max_workers with configure_session().
+    :param func: An fmpsdk endpoint function that takes a 'symbol' argument.
+    :param symbols: The symbols to query.
+    :param max_workers: Maximum number of requests in flight.
+    :param ordered: True yields results in the order of symbols; False yields them
+        as they complete.
+    :param kwargs: Other arguments for func, e.g. apikey=apikey, period="quarter".
+    :return: An iterator of FetchResult.
+    """
+    symbols = iter(symbols)
+    exhausted = object()
+    window = max(1, max_workers) * 2
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = collections.OrderedDict()
+
+        def submit_next() -> bool:
+            symbol = next(symbols, exhausted)
+            if symbol is exhausted:
+                return False
+            # Copy the context so an active FMPClient applies in the workers too.
+            context = contextvars.copy_context()
+            future = executor.submit(
+                context.run, __call_raising, func, symbol=symbol, **kwargs
+            )
+            pending[future] = symbol
+            return True
+
+        while len(pending) < window and submit_next():
+            pass
+        try:
+            yield from _drain(pending, submit_next, ordered)
+        finally:
+            # Consumer stopped early: don't download what nobody will read.
+            for future in pending:
+                future.cancel()
+
+
+def _drain(
+    pending: typing.Dict[concurrent.futures.Future, str],
+    submit_next: typing.Callable[[], bool],
+    ordered: bool,
+) -> typing.Iterator[FetchResult]:
+    """Yield results of pending futures, topping the window up as each one finishes."""
+    while pending:
+        if ordered:
+            future = next(iter(pending))
+            concurrent.futures.wait([future])
+        else:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            future = next(iter(done))
+        symbol = pending.pop(future)
+        submit_next()
+        error = future.exception()
+        if error is None:
+            yield FetchResult(symbol=symbol, value=future.result())
+        else:
+            yield FetchResult(symbol=symbol, error=error)
+
+
+def call_all(
+    func: typing.Callable,
+    calls: typing.List[typing.Dict],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> typing.List[typing.Any]:
+    """
+    Call func once per set of keyword arguments on a pool of threads.
+
+    The calls run in copies of the caller's context, so an active FMPClient (and
+    request error raising, see __call_raising) applies to them too.  The first
+    exception is raised once every call has finished or been cancelled.
+    :param func: Function to call.
+    :param calls: Keyword arguments of each call.
+    :param max_workers: Maximum number of calls in flight.
+    :return: The results, in the order of calls.
+    """
+    workers = max(1, min(max_workers, len(calls)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, **kwargs)
+            for kwargs in calls
+        ]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
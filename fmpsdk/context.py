@@ -0,0 +1,40 @@
+import contextvars
+import threading
+import typing
+
+# The FMPClient whose configuration applies to the current call (set while one of its
+# methods runs).  Outside of client methods the default client is used.
+_active_client: contextvars.ContextVar = contextvars.ContextVar(
+    "fmpsdk_client", default=None
+)
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def default_client() -> typing.Any:
+    """
+    Return the client used by the module-level functions.
+
+    The configure_*() functions (configure_session, configure_retry, ...) change
+    this client.
+    :return: The default FMPClient.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                # Imported here: client.py needs the modules that import this one.
+                from .client import FMPClient
+
+                _default_client = FMPClient()
+    return _default_client
+
+
+def current_client() -> typing.Any:
+    """
+    Return the client whose configuration applies right now.
+
+    :return: The active FMPClient, or the default one.
+    """
+    client = _active_client.get()
+    return client if client is not None else default_client()
@@ -0,0 +1,168 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing
+import zlib
+
+from .cache import prefix_ttl
+from .context import current_client, default_client
+from .settings import DISK_CACHE_TTLS
+
+
+class SQLiteConnections:
+    """
+    Connections to one SQLite file in WAL mode, one per thread of each process.
+
+    WAL lets readers in other processes carry on during the (short) writes, and the
+    busy timeout makes writers wait for each other's locks instead of failing.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """
+        :return: The calling thread's connection, opened on first use.
+        """
+        # Connections must not cross threads, nor survive a fork.
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+
+class DiskCache:
+    """
+    Response cache in a SQLite file that many processes can share.
+
+    Response bodies are stored zlib-compressed with an absolute expiry time.  The
+    database runs in WAL mode so readers never block the (short) writes of other
+    processes.  Each thread of each process uses its own connection.  Cache errors
+    are logged and treated as misses; they never fail a request.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: typing.Optional[typing.Dict[str, float]] = None,
+        default_ttl: float = 0,
+        compress_level: int = 6,
+    ):
+        self.path = os.path.abspath(path)
+        self.ttls = dict(DISK_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.compress_level = compress_level
+        self._connections = SQLiteConnections(self.path)
+        with self._connections.get() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, expires REAL NOT NULL)"
+            )
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Return how long responses for an endpoint may be cached.
+
+        :param path: Path after TLD of URL
+        :return: TTL in seconds, 0 when the endpoint is not cached.
+        """
+        return prefix_ttl(self.ttls, path, self.default_ttl)
+
+    def get(self, key: str) -> typing.Optional[bytes]:
+        """
+        Look a response body up.
+
+        :param key: Key built by cache.cache_key().
+        :return: The response body, or None on a miss.
+        """
+        try:
+            row = (
+                self._connections.get()
+                .execute(
+                    "SELECT body FROM responses WHERE key = ? AND expires > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+            return zlib.decompress(row[0]) if row is not None else None
+        except (sqlite3.Error, zlib.error) as e:
+            logging.warning(f"Disk cache read from {self.path} failed: {e}")
+            return None
+
+    def set(self, key: str, content: bytes, ttl: float) -> None:
+        """
+        Store a response body.
+
+        :param key: Key built by cache.cache_key().
+        :param content: Response body.
+        :param ttl: Lifetime in seconds.
+        :return: None
+        """
+        if ttl <= 0:
+            return
+        try:
+            with self._connections.get() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, body, expires) VALUES (?, ?, ?)",
+                    (
+                        key,
+                        zlib.compress(content, self.compress_level),
+                        time.time() + ttl,
+                    ),
+                )
+        except sqlite3.Error as e:
+            logging.warning(f"Disk cache write to {self.path} failed: {e}")
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+
+        :return: Number of entries deleted.
+        """
+        with self._connections.get() as conn:
+            return conn.execute(
+                "DELETE FROM responses WHERE expires <= ?", (time.time(),)
+            ).rowcount
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._connections.get() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+def configure_disk_cache(
+    path: typing.Optional[str] = None,
+    ttls: typing.Optional[typing.Dict[str, float]] = None,
+    default_ttl: float = 0,
+) -> typing.Optional[DiskCache]:
+    """
+    Turn the SQLite response cache on or off.
+
+    Processes that configure the same path share the cache.
+    :param path: Database file.  None turns the disk cache off.
+    :param ttls: TTL in seconds by endpoint path prefix.  Defaults to
+        settings.DISK_CACHE_TTLS (reference lists, price history, fundamentals).
+    :param default_ttl: TTL for endpoints not matched by ttls (0 = not cached).
+    :return: The new cache, or None if the disk cache was turned off.
+    """
+    disk_cache = (
+        DiskCache(path=path, ttls=ttls, default_ttl=default_ttl) if path else None
+    )
+    default_client().disk_cache = disk_cache
+    return disk_cache
+
+
+def get_disk_cache() -> typing.Optional[DiskCache]:
+    """
+    Return the disk cache of the active FMPClient, or None if it is off.
+
+    :return: The DiskCache or None.
+    """
+    return current_client().disk_cache
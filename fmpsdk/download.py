@@ -0,0 +1,51 @@
+import os
+import typing
+
+from .concurrency import FetchResult, fetch_many
+from .settings import DEFAULT_MAX_WORKERS
+
+
+def download_many(
+    func: typing.Callable,
+    symbols: typing.Iterable[str],
+    filename: str = "{symbol}.csv",
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    ordered: bool = False,
+    **kwargs,
+) -> typing.Iterator[FetchResult]:
+    """
+    Download one file per symbol in parallel.
+
+    Each file is streamed to disk in chunks and only appears under its final name
+    once it is complete (see url_methods.__download_v3).
+
+    Example:
+        for r in download_many(
+            fmpsdk.income_statement, symbols, filename="data/{symbol}_income.csv",
+            apikey=apikey, download=True, period="quarter",
+        ):
+            if not r.ok:
+                print(r.symbol, r.error)
+
+    :param func: An fmpsdk function that takes 'symbol' and 'filename' arguments,
+        e.g. financial_statement, income_statement, balance_sheet_statement.
+    :param symbols: The symbols to download.
+    :param filename: File name template; {symbol} is replaced by each symbol.
+    :param max_workers: Maximum number of downloads in flight.
+    :param ordered: True yields results in the order of symbols; False yields them
+        as they complete.
+    :param kwargs: Other arguments for func, e.g. apikey=apikey, download=True.
+    :return: An iterator of FetchResult whose value is the saved file name.
+    """
+
+    def download_one(symbol: str, **func_kwargs) -> str:
+        path = filename.format(symbol=symbol)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        func(symbol=symbol, filename=path, **func_kwargs)
+        return path
+
+    return fetch_many(
+        download_one, symbols, max_workers=max_workers, ordered=ordered, **kwargs
+    )
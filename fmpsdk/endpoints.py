@@ -0,0 +1,49 @@
+import importlib
+import inspect
+import typing
+
+# Modules whose public functions are FMP API endpoints.
+ENDPOINT_MODULES: typing.Tuple[str, ...] = (
+    "alternative_data",
+    "bulk",
+    "calendar",
+    "commodities",
+    "company_valuation",
+    "cryptocurrencies",
+    "economic_indicators",
+    "etf",
+    "euronext",
+    "forex",
+    "general",
+    "insider_trading",
+    "institutional_fund",
+    "market_indexes",
+    "mutual_funds",
+    "news",
+    "senate",
+    "shares_float",
+    "stock_market",
+    "stock_time_series",
+    "technical_indicators",
+    "tsx",
+)
+
+_endpoint_functions: typing.Optional[typing.Dict[str, typing.Callable]] = None
+
+
+def endpoint_functions() -> typing.Dict[str, typing.Callable]:
+    """
+    Return every endpoint function of the package by name.
+
+    :return: Dictionary of function name -> function.
+    """
+    global _endpoint_functions
+    if _endpoint_functions is None:
+        functions = {}
+        for module_name in ENDPOINT_MODULES:
+            module = importlib.import_module(f".{module_name}", __package__)
+            for name, func in inspect.getmembers(module, inspect.isfunction):
+                if func.__module__ == module.__name__ and not name.startswith("_"):
+                    functions[name] = func
+        _endpoint_functions = functions
+    return _endpoint_functions
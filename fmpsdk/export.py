@@ -0,0 +1,228 @@
+"""
+Write endpoint results to Parquet or Arrow IPC files while they stream in.
+
+export_table() reads the response in batches (see streaming.iter_batches) and writes
+each batch as a Parquet row group / Arrow record batch with a fixed, typed schema,
+so readers can memory-map the file and load only the columns they need.
+
+Requires pyarrow: ``pip install fmpsdk[arrow]``.
+"""
+
+import logging
+import os
+import typing
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:
+    raise ImportError(
+        "fmpsdk.export requires pyarrow.  Install it with 'pip install fmpsdk[arrow]'."
+    ) from e
+
+from .settings import DEFAULT_STREAM_BATCH_SIZE, DEFAULT_STREAM_CHUNK_SIZE
+from .streaming import iter_batches
+from .url_methods import __atomic_writer, __capture_request
+
+# Arrow schemas of the bulk endpoints, by endpoint path prefix.
+SCHEMAS: typing.Dict[str, pa.Schema] = {
+    "batch-historical-eod": pa.schema(
+        [
+            ("symbol", pa.string()),
+            ("date", pa.date32()),
+            ("open", pa.float64()),
+            ("high", pa.float64()),
+            ("low", pa.float64()),
+            ("close", pa.float64()),
+            ("adjClose", pa.float64()),
+            ("volume", pa.int64()),
+        ]
+    ),
+    "profile-bulk": pa.schema(
+        [
+            ("symbol", pa.string()),
+            ("price", pa.float64()),
+            ("marketCap", pa.float64()),
+            ("beta", pa.float64()),
+            ("lastDividend", pa.float64()),
+            ("range", pa.string()),
+            ("change", pa.float64()),
+            ("changePercentage", pa.float64()),
+            ("volume", pa.int64()),
+            ("averageVolume", pa.int64()),
+            ("companyName", pa.string()),
+            ("currency", pa.string()),
+            ("cik", pa.string()),
+            ("isin", pa.string()),
+            ("cusip", pa.string()),
+            ("exchangeFullName", pa.string()),
+            ("exchange", pa.string()),
+            ("industry", pa.string()),
+            ("website", pa.string()),
+            ("description", pa.string()),
+            ("ceo", pa.string()),
+            ("sector", pa.string()),
+            ("country", pa.string()),
+            ("fullTimeEmployees", pa.int64()),
+            ("phone", pa.string()),
+            ("address", pa.string()),
+            ("city", pa.string()),
+            ("state", pa.string()),
+            ("zip", pa.string()),
+            ("image", pa.string()),
+            ("ipoDate", pa.date32()),
+            ("defaultImage", pa.bool_()),
+            ("isEtf", pa.bool_()),
+            ("isActivelyTrading", pa.bool_()),
+            ("isAdr", pa.bool_()),
+            ("isFund", pa.bool_()),
+        ]
+    ),
+    "scores-bulk": pa.schema(
+        [
+            ("symbol", pa.string()),
+            ("reportedCurrency", pa.string()),
+            ("altmanZScore", pa.float64()),
+            ("piotroskiScore", pa.int64()),
+            ("workingCapital", pa.float64()),
+            ("totalAssets", pa.float64()),
+            ("retainedEarnings", pa.float64()),
+            ("ebit", pa.float64()),
+            ("marketCap", pa.float64()),
+            ("totalLiabilities", pa.float64()),
+            ("revenue", pa.float64()),
+        ]
+    ),
+    "upgrades-downgrades-consensus-bulk": pa.schema(
+        [
+            ("symbol", pa.string()),
+            ("strongBuy", pa.int64()),
+            ("buy", pa.int64()),
+            ("hold", pa.int64()),
+            ("sell", pa.int64()),
+            ("strongSell", pa.int64()),
+            ("consensus", pa.string()),
+        ]
+    ),
+}
+
+FILE_FORMATS: typing.List[str] = ["parquet", "arrow"]
+
+
+def export_table(
+    func: typing.Callable,
+    path: str,
+    *args,
+    file_format: typing.Optional[str] = None,
+    schema: typing.Optional[pa.Schema] = None,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    **kwargs,
+) -> int:
+    """
+    Stream the result of an endpoint function into a Parquet or Arrow IPC file.
+
+    Made for bulk_historical_eod, bulk_profiles, scores_bulk and
+    upgrades_downgrades_consensus_bulk, whose schemas are in SCHEMAS; for other
+    endpoints pass schema, or it is inferred from the first batch.  Columns not in
+    the schema are dropped (with a warning) and missing ones are null.  Memory use is
+    bounded by batch_size, and path is only replaced once the file is complete.  Like
+    iter_rows(), request errors are raised.
+
+    Example:
+        export_table(fmpsdk.bulk_profiles, "profiles.parquet", apikey=apikey, part=0)
+    :param func: An fmpsdk endpoint function.
+    :param path: File to write.
+    :param args: Arguments for func.
+    :param file_format: "parquet" or "arrow".  Defaults to "arrow" for .arrow,
+        .feather and .ipc files and "parquet" otherwise.
+    :param schema: Overrides the schema in SCHEMAS.
+    :param batch_size: Rows per row group / record batch.
+    :param chunk_size: Bytes read from the socket at a time.
+    :param kwargs: Arguments for func.
+    :return: Number of rows written.
+    """
+    if file_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        file_format = (
+            "arrow" if extension in (".arrow", ".feather", ".ipc") else "parquet"
+        )
+    if file_format not in FILE_FORMATS:
+        raise ValueError(
+            f"Invalid file_format value: {file_format}.  Valid options: {FILE_FORMATS}"
+        )
+    if schema is None:
+        request, _ = __capture_request(func, *args, **kwargs)
+        if request is not None:
+            schema = next(
+                (s for prefix, s in SCHEMAS.items() if request.path.startswith(prefix)),
+                None,
+            )
+
+    batches = iter_batches(
+        func,
+        *args,
+        batch_size=batch_size,
+        columnar=True,
+        chunk_size=chunk_size,
+        **kwargs,
+    )
+    rows = 0
+    with __atomic_writer(path) as f:
+        writer = None
+        try:
+            for columns in batches:
+                if schema is None:
+                    schema = pa.Table.from_pydict(columns).schema
+                dropped = set(columns) - set(schema.names)
+                if dropped and writer is None:
+                    logging.warning(
+                        f"Columns not in the schema are not exported: {sorted(dropped)}"
+                    )
+                length = len(next(iter(columns.values()), []))
+                batch = pa.record_batch(
+                    [
+                        _arrow_array(columns.get(field.name), field.type, length)
+                        for field in schema
+                    ],
+                    schema=schema,
+                )
+                if writer is None:
+                    writer = _open_writer(f, schema, file_format)
+                if file_format == "parquet":
+                    writer.write_table(pa.Table.from_batches([batch]))
+                else:
+                    writer.write_batch(batch)
+                rows += batch.num_rows
+            if writer is None:
+                writer = _open_writer(f, schema or pa.schema([]), file_format)
+        finally:
+            if writer is not None:
+                writer.close()
+    return rows
+
+
+def _open_writer(f: typing.BinaryIO, schema: pa.Schema, file_format: str):
+    if file_format == "parquet":
+        return pq.ParquetWriter(f, schema)
+    return pa.ipc.new_file(f, schema)
+
+
+def _arrow_array(
+    values: typing.Optional[list], arrow_type: pa.DataType, length: int
+) -> pa.Array:
+    if values is None:
+        return pa.nulls(length, arrow_type)
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    # Text from CSV responses, or numbers of another kind (1.5e7 for an int64).
+    text = pa.array(
+        [None if v is None or v == "" else str(v) for v in values], type=pa.string()
+    )
+    if pa.types.is_date(arrow_type):
+        return text.cast(pa.timestamp("s")).cast(arrow_type)
+    if pa.types.is_integer(arrow_type):
+        return text.cast(pa.float64()).cast(arrow_type)
+    return text.cast(arrow_type)
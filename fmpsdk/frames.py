@@ -0,0 +1,55 @@
+"""
+pandas DataFrames from fmpsdk results.
+
+to_frame() turns the list of dictionaries returned by an endpoint function into a
+DataFrame with typed columns; FMPClient(output="dataframe") applies it to every
+method.
+
+Requires pandas: ``pip install fmpsdk[pandas]``.
+"""
+
+import typing
+
+try:
+    import pandas as pd
+except ImportError as e:
+    raise ImportError(
+        "fmpsdk.frames requires pandas.  Install it with 'pip install fmpsdk[pandas]'."
+    ) from e
+
+
+def to_frame(records: typing.Any) -> typing.Any:
+    """
+    Build a DataFrame from an endpoint result.
+
+    Columns named "date", "datetime" or ending in "Date"/"date" that hold text are
+    parsed to datetime64 in one vectorized call.  Other columns keep the types of the
+    result: JSON numbers and booleans arrive typed, datatype=csv responses are typed
+    per coercion.CSV_SCHEMAS, and text fields (CUSIPs, zip codes, numeric tickers)
+    stay text.  A single dictionary gives a one-row frame; None (a failed request)
+    and other values are returned unchanged.
+    :param records: What an fmpsdk endpoint function returned.
+    :return: A pandas.DataFrame, or records itself if it is not tabular.
+    """
+    if isinstance(records, dict):
+        records = [records]
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        return records
+    frame = pd.DataFrame.from_records(records)
+    for name in frame.columns:
+        column = frame[name]
+        if not _is_date_column(name) or (
+            column.dtype != object and not pd.api.types.is_string_dtype(column)
+        ):
+            continue
+        values = column.replace("", None)
+        dates = pd.to_datetime(values, errors="coerce", format="ISO8601")
+        if dates.notna().sum() == values.notna().sum():
+            frame[name] = dates
+    return frame
+
+
+def _is_date_column(name: typing.Any) -> bool:
+    return isinstance(name, str) and (
+        name in ("date", "datetime") or name.endswith(("Date", "date"))
+    )
@@ -1,6 +1,8 @@
 import typing
 
-from .settings import DEFAULT_LINE_PARAMETER
+from .batching import fetch_chunked
+from .ranges import fetch_range
+from .settings import DEFAULT_LINE_PARAMETER, HISTORICAL_CHART_WINDOW_DAYS
 from .url_methods import __return_json_v3, __validate_series_type, __validate_time_delta
 
 
@@ -26,15 +28,31 @@ def quote(
 
     This API endpoint is a multifunction tool!
 
+    Long symbol lists are split into several requests (see batching.symbol_chunks)
+    that run in parallel; the rows come back in the order of the list.
+
     :param apikey: Your API key
     :param symbol: The Ticker(s), Index(es), Commodity(ies), etc. symbol to query for.
     :return: A list of dictionaries.
     """
     if type(symbol) is list:
-        symbol = ",".join(symbol)
+        return fetch_chunked(__quote_list, symbol, apikey=apikey)
     return __quotes(apikey=apikey, value=symbol)
 
 
+def __quote_list(
+    apikey: str, symbol: typing.List[str]
+) -> typing.Optional[typing.List[typing.Dict]]:
+    """
+    Query FMP Quote API for one list of symbols.
+
+    :param apikey: Your API key
+    :param symbol: The Tickers to query for.
+    :return: A list of dictionaries.
+    """
+    return __quotes(apikey=apikey, value=",".join(symbol))
+
+
 def historical_chart(
     apikey: str,
     symbol: str,
@@ -48,6 +66,10 @@ def historical_chart(
 
     This API endpoint is a multifunction tool!
 
+    One response only holds a limited span of intraday bars, so longer ranges are
+    split into windows (see HISTORICAL_CHART_WINDOW_DAYS) that are fetched in
+    parallel and merged into one list, newest first, without duplicate bars.
+
     :param apikey: Your API key
     :param symbol: The Ticker, Index, Commodity, etc. symbol to query for.
     :param time_delta: The string value of time from now to go historical "1min" - "4hour".
@@ -55,6 +77,40 @@ def historical_chart(
     :param to_date: The ending time for the API ("yyyy-mm-dd")
     :param time_series: line as default
 
+    :return: A list of dictionaries.
+    """
+    return fetch_range(
+        __historical_chart,
+        from_date=from_date,
+        to_date=to_date,
+        days=HISTORICAL_CHART_WINDOW_DAYS.get(time_delta),
+        key=lambda bar: bar.get("date"),
+        sort_key=lambda bar: bar.get("date") or "",
+        newest_first=True,
+        apikey=apikey,
+        symbol=symbol,
+        time_delta=time_delta,
+        time_series=time_series,
+    )
+
+
+def __historical_chart(
+    apikey: str,
+    symbol: str,
+    time_delta: str,
+    from_date: str,
+    to_date: str,
+    time_series: str = DEFAULT_LINE_PARAMETER,
+) -> typing.Optional[typing.List[typing.Dict]]:
+    """
+    Query FMP Historical Chart API for one window.
+
+    :param apikey: Your API key
+    :param symbol: The Ticker, Index, Commodity, etc. symbol to query for.
+    :param time_delta: The string value of time from now to go historical "1min" - "4hour".
+    :param from_date: The starting time for the API ("yyyy-mm-dd")
+    :param to_date: The ending time for the API ("yyyy-mm-dd")
+    :param time_series: line as default
     :return: A list of dictionaries.
     """
     path = f"historical-chart/{__validate_time_delta(time_delta)}/{symbol}"
@@ -100,9 +156,16 @@ def historical_price_full(
     if to_date:
         query_vars["to"] = to_date
 
-    res = __return_json_v3(path=path, query_vars=query_vars)
+    return __return_json_v3(
+        path=path, query_vars=query_vars, transform=__historical_price_full_rows
+    )
+
 
-    if res:
-        return res.get("historicalStockList", res.get("historical", None))
-    else:
-        return res
+def __historical_price_full_rows(res: typing.Dict) -> typing.Optional[typing.List]:
+    """
+    Unwrap the bar list(s) from a /historical-price-full/ response.
+
+    :param res: Decoded JSON response.
+    :return: A list of dictionaries.
+    """
+    return res.get("historicalStockList", res.get("historical", None))
@@ -0,0 +1,201 @@
+import datetime
+import logging
+import os
+import sqlite3
+import typing
+
+from .coercion import to_int
+from .concurrency import FetchResult, fetch_many
+from .disk_cache import SQLiteConnections
+from .general import historical_price_full
+from .records import Bar
+from .settings import DEFAULT_MAX_WORKERS, DEFAULT_SYNC_REVISION_BARS
+
+# Stored fields of a daily bar, in column order.
+FIELDS: typing.Tuple[str, ...] = Bar.__slots__
+
+
+class SyncResult(typing.NamedTuple):
+    """What HistoryStore.sync_symbol() changed for one symbol."""
+
+    symbol: str
+    added: int = 0
+    revised: int = 0
+    reloaded: bool = False
+
+
+class HistoryStore:
+    """
+    Daily bars of historical_price_full() kept in a local SQLite file.
+
+    sync() brings the stored history of each symbol up to date with one small
+    request: only bars after the last stored date are downloaded, plus the last
+    revision_bars stored bars to pick up late corrections.  Corrected bars are
+    replaced; if even the oldest bar of that overlap changed (a split or dividend
+    adjustment rewrites the whole history), the symbol is reloaded in full.  Like
+    DiskCache, the file is in WAL mode and can be shared by processes, with one
+    connection per thread.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self._connections = SQLiteConnections(self.path)
+        columns = ", ".join(f"{name} {_sql_type(name)}" for name in FIELDS)
+        with self._connections.get() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS bars (symbol TEXT NOT NULL, {columns}, "
+                "PRIMARY KEY (symbol, date)) WITHOUT ROWID"
+            )
+
+    def symbols(self) -> typing.List[str]:
+        """
+        :return: Every symbol with stored bars.
+        """
+        rows = self._connections.get().execute(
+            "SELECT DISTINCT symbol FROM bars ORDER BY symbol"
+        )
+        return [symbol for (symbol,) in rows]
+
+    def last_date(self, symbol: str) -> typing.Optional[str]:
+        """
+        :param symbol: The ticker.
+        :return: Date of the newest stored bar ('YYYY-MM-DD'), or None if there is none.
+        """
+        row = (
+            self._connections.get()
+            .execute("SELECT MAX(date) FROM bars WHERE symbol = ?", (symbol,))
+            .fetchone()
+        )
+        return row[0]
+
+    def bars(
+        self,
+        symbol: str,
+        from_date: typing.Optional[str] = None,
+        to_date: typing.Optional[str] = None,
+    ) -> typing.List[typing.Dict]:
+        """
+        Read stored bars.
+
+        :param symbol: The ticker.
+        :param from_date: 'YYYY-MM-DD', inclusive.
+        :param to_date: 'YYYY-MM-DD', inclusive.
+        :return: A list of dictionaries with the keys of historical_price_full() bars,
+            oldest first.
+        """
+        rows = self._connections.get().execute(
+            f"SELECT {', '.join(FIELDS)} FROM bars WHERE symbol = ? "
+            "AND date >= ? AND date <= ? ORDER BY date",
+            (symbol, from_date or "", to_date or "9999-12-31"),
+        )
+        return [dict(zip(FIELDS, row)) for row in rows]
+
+    def sync(
+        self,
+        apikey: str,
+        symbols: typing.Iterable[str],
+        revision_bars: int = DEFAULT_SYNC_REVISION_BARS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> typing.Iterator[FetchResult]:
+        """
+        Bring the stored history of many symbols up to date, in parallel.
+
+        Example:
+            for r in store.sync(apikey, symbols):
+                if not r.ok:
+                    print(r.symbol, "failed:", r.error)
+        :param apikey: Your API key.
+        :param symbols: The tickers.
+        :param revision_bars: Stored bars downloaded again to detect revisions.
+        :param max_workers: Maximum number of requests in flight.
+        :return: An iterator of FetchResult (see fetch_many) whose values are
+            SyncResult.
+        """
+        return fetch_many(
+            self.sync_symbol,
+            symbols,
+            max_workers=max_workers,
+            apikey=apikey,
+            revision_bars=revision_bars,
+        )
+
+    def sync_symbol(
+        self,
+        apikey: str,
+        symbol: str,
+        revision_bars: int = DEFAULT_SYNC_REVISION_BARS,
+    ) -> SyncResult:
+        """
+        Bring the stored history of one symbol up to date.
+
+        :param apikey: Your API key.
+        :param symbol: The ticker.
+        :param revision_bars: Stored bars downloaded again to detect revisions.
+        :return: SyncResult.
+        """
+        conn = self._connections.get()
+        rows = conn.execute(
+            f"SELECT {', '.join(FIELDS)} FROM bars WHERE symbol = ? "
+            "ORDER BY date DESC LIMIT ?",
+            (symbol, max(1, revision_bars)),
+        )
+        stored = [dict(zip(FIELDS, row)) for row in rows]
+        if not stored:
+            return self._reload(apikey, symbol)
+        if revision_bars > 0:
+            overlap = {bar["date"]: bar for bar in stored}
+            from_date = stored[-1]["date"]
+        else:
+            overlap = {}
+            from_date = _next_day(stored[0]["date"])
+        fetched = _fetch_bars(apikey, symbol, from_date)
+        revised = [bar for bar in fetched if bar["date"] in overlap]
+        revised = [bar for bar in revised if bar != overlap[bar["date"]]]
+        if overlap and any(bar["date"] == from_date for bar in revised):
+            logging.info(f"History of {symbol} was revised; reloading it.")
+            return self._reload(apikey, symbol)
+        added = [bar for bar in fetched if bar["date"] not in overlap]
+        with conn:
+            _insert(conn, symbol, revised + added)
+        return SyncResult(symbol=symbol, added=len(added), revised=len(revised))
+
+    def _reload(self, apikey: str, symbol: str) -> SyncResult:
+        fetched = _fetch_bars(apikey, symbol, None)
+        with self._connections.get() as conn:
+            conn.execute("DELETE FROM bars WHERE symbol = ?", (symbol,))
+            _insert(conn, symbol, fetched)
+        return SyncResult(symbol=symbol, added=len(fetched), reloaded=True)
+
+
+def _fetch_bars(
+    apikey: str, symbol: str, from_date: typing.Optional[str]
+) -> typing.List[typing.Dict]:
+    result = historical_price_full(apikey=apikey, symbol=symbol, from_date=from_date)
+    if result is None:
+        raise ValueError(f"No history returned for {symbol}.")
+    history = result if isinstance(result, list) else []
+    return [
+        Bar.from_dict(bar).as_dict()
+        for bar in history
+        if isinstance(bar, dict) and bar.get("date")
+    ]
+
+
+def _insert(
+    conn: sqlite3.Connection, symbol: str, bars: typing.List[typing.Dict]
+) -> None:
+    conn.executemany(
+        f"INSERT OR REPLACE INTO bars (symbol, {', '.join(FIELDS)}) "
+        f"VALUES (?, {', '.join('?' * len(FIELDS))})",
+        [(symbol, *(bar[name] for name in FIELDS)) for bar in bars],
+    )
+
+
+def _next_day(date: str) -> str:
+    return (datetime.date.fromisoformat(date) + datetime.timedelta(days=1)).isoformat()
+
+
+def _sql_type(name: str) -> str:
+    if name == "date":
+        return "TEXT NOT NULL"
+    return "INTEGER" if Bar._types[name] is to_int else "REAL"
@@ -1,10 +1,8 @@
 import logging
 import typing
 
-import requests
-
-from .settings import DEFAULT_LIMIT, SEC_RSS_FEEDS_FILENAME, BASE_URL_v3
-from .url_methods import __return_json_v3, __return_json_v4
+from .settings import DEFAULT_LIMIT, SEC_RSS_FEEDS_FILENAME
+from .url_methods import __download_v3, __return_json_v3, __return_json_v4
 
 
 def institutional_holders(
@@ -99,9 +97,8 @@ def sec_rss_feeds(
     query_vars = {"apikey": apikey}
     if download:
         query_vars["datatype"] = "csv"  # Only CSV is supported.
-        response = requests.get(f"{BASE_URL_v3}{path}", params=query_vars)
-        open(filename, "wb").write(response.content)
-        logging.info(f"Saving SEC RSS Feeds as {filename}.")
+        if __download_v3(path=path, query_vars=query_vars, filename=filename):
+            logging.info(f"Saving SEC RSS Feeds as {filename}.")
     else:
         query_vars["limit"] = limit
         return __return_json_v3(path=path, query_vars=query_vars)
@@ -0,0 +1,84 @@
+import collections
+import concurrent.futures
+import contextvars
+import inspect
+import itertools
+import typing
+
+from .settings import DEFAULT_PAGE_PREFETCH
+from .url_methods import __call_raising
+
+
+def iter_pages(
+    func: typing.Callable,
+    *args,
+    prefetch: int = DEFAULT_PAGE_PREFETCH,
+    start_page: int = 0,
+    max_pages: typing.Optional[int] = None,
+    until: typing.Optional[typing.Callable[[typing.Dict], bool]] = None,
+    **kwargs,
+) -> typing.Iterator[typing.Dict]:
+    """
+    Yield the rows of every page of a paginated endpoint, in page order.
+
+    Works with any endpoint function that has a 'page' argument (insider_trading,
+    insider_trading_latest, stock_news, crypto_news, forex_news, fmp_articles,
+    general_news, news_sentiment_rss, ...).  The next pages are requested while the
+    current one is consumed, so a deep backfill is not bound by one round trip per
+    page.  Iteration ends at the first empty page, after max_pages pages, or at the
+    first row for which until(row) is true (that row is not yielded).  Request errors
+    are raised, as there is no None to return.
+
+    Example:
+        # Everything published since the last run (the feed is newest first).
+        for article in iter_pages(
+            fmpsdk.stock_news, apikey=apikey, tickers="AAPL",
+            until=lambda row: row["publishedDate"] <= last_seen,
+        ):
+            ...
+    :param func: An fmpsdk endpoint function with a 'page' argument.
+    :param prefetch: Pages requested ahead of the one being consumed.
+    :param start_page: First page to request.
+    :param max_pages: Maximum number of pages to request (None = no limit).
+    :param until: Watermark test; iteration stops at the first row it accepts.
+    :param args: Arguments for func.
+    :param kwargs: Arguments for func, except page.
+    :return: An iterator of dictionaries.
+    """
+    if "page" not in inspect.signature(func).parameters:
+        raise ValueError(f"{func.__name__}() has no 'page' argument.")
+    if max_pages is None:
+        pages = itertools.count(start_page)
+    else:
+        pages = iter(range(start_page, start_page + max_pages))
+    workers = max(1, prefetch)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+
+        def submit_next() -> None:
+            page = next(pages, None)
+            if page is not None:
+                # Copy the context so an active FMPClient applies in the workers too.
+                context = contextvars.copy_context()
+                pending.append(
+                    executor.submit(
+                        context.run, __call_raising, func, *args, page=page, **kwargs
+                    )
+                )
+
+        for _ in range(workers):
+            submit_next()
+        try:
+            while pending:
+                rows = pending.popleft().result()
+                if not rows:
+                    return
+                submit_next()
+                for row in rows:
+                    if until is not None and until(row):
+                        return
+                    yield row
+        finally:
+            # Stopped early: don't download pages nobody will read.
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,164 @@
+"""
+Poll quotes and emit only what changed.
+
+QuotePoller requests quote() or batch_quote() for a symbol list on an interval,
+keeps the last snapshot as one compact record per symbol (see fmpsdk.records) and
+reports, per symbol, just the fields whose values moved.  Consume the changes with
+``async for`` or hand them to a callback.
+
+Requires aiohttp: ``pip install fmpsdk[aio]``.
+"""
+
+import asyncio
+import inspect
+import time
+import typing
+
+from . import aio
+from .batching import symbol_chunks
+from .records import RECORD_TYPES, Record
+from .settings import DEFAULT_POLL_INTERVAL, DEFAULT_POLL_MAX_INTERVAL
+
+# Endpoint functions the poller can use, and their symbol list argument.
+POLL_ENDPOINTS: typing.Dict[str, str] = {"quote": "symbol", "batch_quote": "symbols"}
+
+
+class QuoteChange(typing.NamedTuple):
+    """The fields of one symbol that changed since the previous poll."""
+
+    symbol: str
+    changes: typing.Dict[str, typing.Any]
+    quote: Record
+
+
+class QuotePoller:
+    """
+    Change-only quote stream over repeated quote() / batch_quote() requests.
+
+    Every poll requests all symbols (in parallel chunks, see batching.symbol_chunks)
+    and compares each row with the stored record of its symbol.  The interval
+    adapts to market activity: after a poll without any change it doubles, up to
+    max_interval, so a closed market is polled rarely; the first change brings it
+    back to interval.  A failed poll (logged by fmpsdk.aio) is skipped.
+
+    Example:
+        poller = QuotePoller(apikey, ["AAPL", "MSFT"], fields=["price", "volume"])
+        async for change in poller.changes():
+            print(change.symbol, change.changes)
+    """
+
+    def __init__(
+        self,
+        apikey: str,
+        symbols: typing.Iterable[str],
+        endpoint: str = "quote",
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+        emit_initial: bool = True,
+    ):
+        """
+        :param apikey: Your API key.
+        :param symbols: The tickers to watch.
+        :param endpoint: "quote" or "batch_quote".
+        :param fields: Fields to compare (default: every field of the record type).
+        :param interval: Seconds between polls while quotes are moving.
+        :param max_interval: Longest wait between polls while nothing changes.
+        :param emit_initial: True reports every field of the first snapshot.
+        """
+        if endpoint not in POLL_ENDPOINTS:
+            raise ValueError(
+                f"Invalid endpoint value: {endpoint}.  Valid options: {list(POLL_ENDPOINTS)}"
+            )
+        self.apikey = apikey
+        self.symbols = list(dict.fromkeys(symbols))
+        self.endpoint = endpoint
+        self.record_type = RECORD_TYPES[endpoint]
+        self.fields = tuple(self.record_type.__slots__ if fields is None else fields)
+        for field in self.fields:
+            if field not in self.record_type.__slots__:
+                raise ValueError(
+                    f"Invalid field: {field}.  Valid options: {list(self.record_type.__slots__)}"
+                )
+        self.interval = interval
+        self.max_interval = max(interval, max_interval)
+        self.emit_initial = emit_initial
+        # Latest record by symbol.
+        self.snapshot: typing.Dict[str, Record] = {}
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Make changes() and run() return after the current poll."""
+        self._stopped = True
+
+    async def poll(self) -> typing.List[QuoteChange]:
+        """
+        Request every symbol once and update the snapshot.
+
+        :return: The changes since the previous poll, in the order of the rows.
+        """
+        func = getattr(aio, self.endpoint)
+        argument = POLL_ENDPOINTS[self.endpoint]
+        results = await asyncio.gather(
+            *[
+                func(apikey=self.apikey, **{argument: chunk})
+                for chunk in symbol_chunks(self.symbols)
+            ]
+        )
+        changes = []
+        for result in results:
+            for row in result if isinstance(result, list) else []:
+                change = self._update(row)
+                if change is not None:
+                    changes.append(change)
+        return changes
+
+    def _update(self, row: typing.Any) -> typing.Optional[QuoteChange]:
+        if not isinstance(row, dict) or row.get("symbol") is None:
+            return None
+        record = self.record_type.from_dict(row)
+        previous = self.snapshot.get(record.symbol)
+        self.snapshot[record.symbol] = record
+        if previous is None:
+            if not self.emit_initial:
+                return None
+            changed = {name: getattr(record, name) for name in self.fields}
+        else:
+            changed = {
+                name: getattr(record, name)
+                for name in self.fields
+                if getattr(record, name) != getattr(previous, name)
+            }
+        if not changed:
+            return None
+        return QuoteChange(symbol=record.symbol, changes=changed, quote=record)
+
+    async def changes(self) -> typing.AsyncIterator[QuoteChange]:
+        """
+        Poll until stop() is called, yielding each change as it is found.
+
+        :return: An async iterator of QuoteChange.
+        """
+        self._stopped = False
+        wait = self.interval
+        while not self._stopped:
+            started = time.monotonic()
+            changes = await self.poll()
+            for change in changes:
+                yield change
+            wait = self.interval if changes else min(wait * 2, self.max_interval)
+            if self._stopped:
+                return
+            await asyncio.sleep(max(0.0, wait - (time.monotonic() - started)))
+
+    async def run(self, callback: typing.Callable[[QuoteChange], typing.Any]) -> None:
+        """
+        Poll until stop() is called, passing each change to callback.
+
+        :param callback: Function or coroutine function taking a QuoteChange.
+        :return: None
+        """
+        async for change in self.changes():
+            result = callback(change)
+            if inspect.isawaitable(result):
+                await result
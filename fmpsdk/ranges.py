@@ -0,0 +1,120 @@
+import datetime
+import functools
+import json
+import typing
+
+from .concurrency import call_all
+from .settings import DEFAULT_MAX_WORKERS
+from .url_methods import __capture_split, _capturing
+
+
+def date_windows(
+    from_date: typing.Union[str, datetime.date],
+    to_date: typing.Union[str, datetime.date],
+    days: int,
+) -> typing.Optional[typing.List[typing.Tuple[str, str]]]:
+    """
+    Split an inclusive date range into consecutive windows of at most days days.
+
+    :param from_date: 'YYYY-MM-DD' or a date.
+    :param to_date: 'YYYY-MM-DD' or a date.
+    :param days: Longest window, in days (both ends included).
+    :return: A list of ('YYYY-MM-DD', 'YYYY-MM-DD') pairs, oldest first, or None if
+        either end is missing or not a date.
+    """
+    try:
+        start, end = _as_date(from_date), _as_date(to_date)
+    except (TypeError, ValueError):
+        return None
+    windows = []
+    step = datetime.timedelta(days=max(1, days))
+    while start <= end:
+        stop = min(start + step - datetime.timedelta(days=1), end)
+        windows.append((start.isoformat(), stop.isoformat()))
+        start = stop + datetime.timedelta(days=1)
+    return windows
+
+
+def fetch_range(
+    func: typing.Callable,
+    from_date: typing.Union[str, datetime.date],
+    to_date: typing.Union[str, datetime.date],
+    days: typing.Optional[int],
+    key: typing.Callable[[typing.Dict], typing.Hashable],
+    sort_key: typing.Callable[[typing.Dict], typing.Any],
+    newest_first: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs,
+) -> typing.Optional[typing.List[typing.Dict]]:
+    """
+    Call an endpoint function once per date window, in parallel, and merge the rows.
+
+    Ranges that fit in one window (or that can't be split) are a single plain call.
+    Rows that show up in more than one window are kept once, and the merged rows
+    are sorted by sort_key.  Like the endpoint functions, a failed window makes the
+    whole call return None; with request errors raised (see __call_raising), the
+    first error propagates.  While another front end captures the request (asyncio,
+    streaming, ...), the windows are captured as one SplitRequest for it to send.
+    :param func: Function taking from_date and to_date keyword arguments that sends
+        one request.
+    :param from_date: 'YYYY-MM-DD' or a date.
+    :param to_date: 'YYYY-MM-DD' or a date.
+    :param days: Longest window the server accepts, in days; None for no limit.
+    :param key: Identity of a row, for removing duplicates.
+    :param sort_key: Order of the merged rows.
+    :param newest_first: Sort in descending order.
+    :param max_workers: Maximum number of requests in flight.
+    :param kwargs: Other arguments for func.
+    :return: A list of dictionaries.
+    """
+    windows = date_windows(from_date, to_date, days) if days else None
+    if not windows or len(windows) == 1:
+        return func(from_date=from_date, to_date=to_date, **kwargs)
+    if newest_first:
+        windows.reverse()  # Requests in the order of the merged rows.
+    calls = [dict(kwargs, from_date=start, to_date=stop) for start, stop in windows]
+    merge = functools.partial(
+        _merge_windows, key=key, sort_key=sort_key, newest_first=newest_first
+    )
+    if _capturing.get():
+        return __capture_split(func, calls, merge, key)
+    return merge(call_all(func, calls, max_workers=max_workers))
+
+
+def _merge_windows(
+    results: typing.List,
+    key: typing.Callable[[typing.Dict], typing.Hashable],
+    sort_key: typing.Callable[[typing.Dict], typing.Any],
+    newest_first: bool,
+) -> typing.Optional[typing.List[typing.Dict]]:
+    if any(result is None for result in results):
+        return None
+    rows, seen = [], set()
+    for result in results:
+        if not isinstance(result, list):
+            return result  # An error message, not rows.
+        for row in result:
+            row_key = key(row)
+            if row_key not in seen:
+                seen.add(row_key)
+                rows.append(row)
+    rows.sort(key=sort_key, reverse=newest_first)
+    return rows
+
+
+def row_identity(row: typing.Dict) -> str:
+    """
+    Identity of a row by all of its values, for rows without a natural key.
+
+    :param row: A dictionary.
+    :return: A hashable key.
+    """
+    return json.dumps(row, sort_keys=True, default=str)
+
+
+def _as_date(value: typing.Union[str, datetime.date]) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value[:10])
@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+import typing
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .context import current_client, default_client
+from .settings import FMP_PLAN_REQUESTS_PER_MINUTE
+
+
+class TokenBucket:
+    """
+    Token bucket shared by all threads of this process.
+
+    The bucket holds up to 'burst' tokens and refills at requests_per_minute / 60
+    tokens per second.  Each request takes one token; when the bucket is empty the
+    caller waits.  Tokens are reserved under the lock and the wait happens outside
+    it, so waiting threads are served in arrival order.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: typing.Optional[int] = None):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be greater than 0.")
+        self.rate = requests_per_minute / 60.0
+        self.burst = burst if burst is not None else max(1, int(self.rate))
+        self._tokens = float(self.burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, possibly one that has not been refilled yet.
+
+        :return: Seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._stamp) * self.rate
+            )
+            self._stamp = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket shared by every process that points at the same state file.
+
+    The bucket state lives in a small file guarded by an exclusive flock(), so
+    several worker processes on one machine can share a single plan limit.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        burst: typing.Optional[int] = None,
+        path: str = "",
+    ):
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucket requires fcntl (POSIX only).")
+        if not path:
+            raise ValueError("FileTokenBucket requires a path.")
+        super().__init__(requests_per_minute=requests_per_minute, burst=burst)
+        self.path = path
+
+    def reserve(self) -> float:
+        # The thread lock avoids every thread opening the file at once; flock covers
+        # other processes.  time.time() is used because monotonic clocks are not
+        # comparable between processes.
+        with self._lock, open(self.path, "a+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                fields = f.read().split()
+                now = time.time()
+                if len(fields) == 2:
+                    tokens, stamp = float(fields[0]), float(fields[1])
+                else:
+                    tokens, stamp = float(self.burst), now
+                tokens = min(self.burst, tokens + max(0.0, now - stamp) * self.rate)
+                tokens -= 1
+                f.seek(0)
+                f.truncate()
+                f.write(f"{tokens!r} {now!r}")
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return 0.0 if tokens >= 0 else -tokens / self.rate
+
+
+def configure_rate_limit(
+    requests_per_minute: typing.Optional[float] = None,
+    burst: typing.Optional[int] = None,
+    plan: typing.Optional[str] = None,
+    path: typing.Optional[str] = None,
+) -> typing.Optional[TokenBucket]:
+    """
+    Pace every request sent by fmpsdk.
+
+    Call with no arguments to turn rate limiting off (the default).
+    :param requests_per_minute: Sustained request rate.
+    :param burst: Number of requests that may be sent back to back after an idle
+        period.  Defaults to one second's worth of requests.
+    :param plan: FMP plan name (see settings.FMP_PLAN_REQUESTS_PER_MINUTE) used when
+        requests_per_minute is not given.
+    :param path: Optional state file.  Processes that use the same path share one
+        limit (POSIX only).
+    :return: The new limiter, or None if rate limiting was turned off.
+    """
+    if requests_per_minute is None and plan is not None:
+        try:
+            requests_per_minute = FMP_PLAN_REQUESTS_PER_MINUTE[plan.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Invalid plan value: {plan}.  Valid options: "
+                f"{list(FMP_PLAN_REQUESTS_PER_MINUTE.keys())}"
+            )
+    if requests_per_minute is None:
+        limiter = None
+    elif path:
+        limiter = FileTokenBucket(
+            requests_per_minute=requests_per_minute,
+            burst=burst,
+            path=os.path.abspath(path),
+        )
+    else:
+        limiter = TokenBucket(requests_per_minute=requests_per_minute, burst=burst)
+    default_client().rate_limiter = limiter
+    return limiter
+
+
+def get_rate_limiter() -> typing.Optional[TokenBucket]:
+    """
+    Return the limiter of the active FMPClient, or None if there is none.
+
+    :return: The active TokenBucket or None.
+    """
+    return current_client().rate_limiter
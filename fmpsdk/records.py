@@ -0,0 +1,191 @@
+import typing
+
+from .coercion import to_int
+
+
+def _float(value: typing.Any) -> typing.Optional[float]:
+    return None if value is None or value == "" else float(value)
+
+
+def _str(value: typing.Any) -> typing.Optional[str]:
+    return None if value is None else str(value)
+
+
+class Record:
+    """
+    Base of the compact record types.
+
+    Records keep their fields in __slots__ (no per-instance dictionary) and coerce
+    them on construction, so a snapshot of tens of thousands of quotes costs a
+    fraction of the equivalent dictionaries.  Field names are the API's keys; keys a
+    record type does not know are dropped, missing ones are None.
+    """
+
+    __slots__ = ()
+    _types: typing.Dict[str, typing.Callable] = {}
+
+    def __init__(self, **fields):
+        for name, convert in self._types.items():
+            setattr(self, name, convert(fields.get(name)))
+
+    @classmethod
+    def from_dict(cls, row: typing.Dict) -> "Record":
+        """
+        Build a record from one row of an endpoint result.
+
+        :param row: Dictionary as returned by the endpoint function.
+        :return: The record.
+        """
+        return cls(**row)
+
+    def as_dict(self) -> typing.Dict:
+        """
+        :return: The fields as a dictionary.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__
+            if getattr(self, name) is not None
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+class Quote(Record):
+    """One row of quote() / exchange_realtime()."""
+
+    _types = {
+        "symbol": _str,
+        "name": _str,
+        "price": _float,
+        "changesPercentage": _float,
+        "change": _float,
+        "dayLow": _float,
+        "dayHigh": _float,
+        "yearHigh": _float,
+        "yearLow": _float,
+        "marketCap": _float,
+        "priceAvg50": _float,
+        "priceAvg200": _float,
+        "exchange": _str,
+        "volume": to_int,
+        "avgVolume": to_int,
+        "open": _float,
+        "previousClose": _float,
+        "eps": _float,
+        "pe": _float,
+        "earningsAnnouncement": _str,
+        "sharesOutstanding": to_int,
+        "timestamp": to_int,
+    }
+    __slots__ = tuple(_types)
+
+
+class QuoteShort(Record):
+    """One row of quote_short()."""
+
+    _types = {"symbol": _str, "price": _float, "volume": to_int}
+    __slots__ = tuple(_types)
+
+
+class PrePostQuote(Record):
+    """One row of batch_quote() (pre/post market bid and ask)."""
+
+    _types = {
+        "symbol": _str,
+        "bid": _float,
+        "ask": _float,
+        "bsize": to_int,
+        "asize": to_int,
+        "timestamp": to_int,
+    }
+    __slots__ = tuple(_types)
+
+
+class LivePrice(Record):
+    """One row of live_full_price() / full_real_time_price()."""
+
+    _types = {
+        "symbol": _str,
+        "bid": _float,
+        "ask": _float,
+        "bidSize": to_int,
+        "askSize": to_int,
+        "bidPrice": _float,
+        "askPrice": _float,
+        "price": _float,
+        "lastSalePrice": _float,
+        "lastSaleSize": to_int,
+        "lastSaleTime": to_int,
+        "fmpLast": _float,
+        "volume": to_int,
+        "timestamp": to_int,
+        "lastUpdated": to_int,
+    }
+    __slots__ = tuple(_types)
+
+
+class Bar(Record):
+    """One bar of historical_price_full() / historical_chart()."""
+
+    _types = {
+        "date": _str,
+        "open": _float,
+        "high": _float,
+        "low": _float,
+        "close": _float,
+        "adjClose": _float,
+        "volume": to_int,
+        "unadjustedVolume": to_int,
+        "change": _float,
+        "changePercent": _float,
+        "vwap": _float,
+        "changeOverTime": _float,
+    }
+    __slots__ = tuple(_types)
+
+
+# Record type by endpoint function name.
+RECORD_TYPES: typing.Dict[str, typing.Type[Record]] = {
+    "quote": Quote,
+    "exchange_realtime": Quote,
+    "quote_short": QuoteShort,
+    "batch_quote": PrePostQuote,
+    "live_full_price": LivePrice,
+    "full_real_time_price": LivePrice,
+    "historical_price_full": Bar,
+    "historical_chart": Bar,
+}
+
+
+def to_objects(result: typing.Any, record_type: typing.Type[Record]) -> typing.Any:
+    """
+    Convert the rows of an endpoint result to record objects.
+
+    Multi-symbol historical_price_full results keep their {"symbol", "historical"}
+    wrappers, with the bars inside converted.
+    :param result: What the endpoint function returned.
+    :param record_type: One of the Record subclasses, see RECORD_TYPES.
+    :return: A list of records (a single record for a dictionary result), or result
+        unchanged if it holds no rows (e.g. None after a failed request).
+    """
+    if isinstance(result, dict):
+        return record_type.from_dict(result)
+    if not isinstance(result, list):
+        return result
+    return [_to_object(row, record_type) for row in result]
+
+
+def _to_object(row: typing.Any, record_type: typing.Type[Record]) -> typing.Any:
+    if not isinstance(row, dict):
+        return row
+    if "historical" in row:
+        return dict(row, historical=to_objects(row["historical"], record_type))
+    return record_type.from_dict(row)
@@ -0,0 +1,131 @@
+import datetime
+import email.utils
+import random
+import typing
+
+from .context import current_client, default_client
+from .settings import (
+    DEFAULT_RETRY_BACKOFF_BASE,
+    DEFAULT_RETRY_BACKOFF_CAP,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_MAX_RETRY_AFTER,
+    DEFAULT_RETRY_STATUSES,
+    BASE_URL_v3,
+    BASE_URL_v4,
+    BASE_URL_STABLE,
+)
+
+_API_VERSIONS: typing.Dict[str, str] = {
+    BASE_URL_v3: "v3",
+    BASE_URL_v4: "v4",
+    BASE_URL_STABLE: "stable",
+}
+
+
+class RetryPolicy(typing.NamedTuple):
+    """
+    How often and how long to retry a failed request.
+
+    Connection errors, timeouts and responses with a status in retry_statuses are
+    retried.  The wait before retry n (starting at 0) is drawn uniformly from
+    [0, min(backoff_cap, backoff_base * 2**n)] ("full jitter"), unless the server sent
+    a Retry-After header on a 429/503, which is honored instead.  A Retry-After
+    longer than max_retry_after is not waited for: the response is returned as is.
+    """
+
+    max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS
+    backoff_base: float = DEFAULT_RETRY_BACKOFF_BASE
+    backoff_cap: float = DEFAULT_RETRY_BACKOFF_CAP
+    retry_statuses: typing.FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    respect_retry_after: bool = True
+    max_retry_after: float = DEFAULT_RETRY_MAX_RETRY_AFTER
+
+    def delay(self, attempt: int, retry_after: typing.Optional[float] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        :param attempt: Number of the attempt that just failed, starting at 0.
+        :param retry_after: Value of the Retry-After header in seconds, if any.
+        :return: Seconds to sleep.
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return min(max(0.0, retry_after), self.max_retry_after)
+        return random.uniform(
+            0, min(self.backoff_cap, self.backoff_base * (2**attempt))
+        )
+
+    def gives_up(self, retry_after: typing.Optional[float]) -> bool:
+        """
+        Whether the server asked for a longer wait than this policy allows.
+
+        :param retry_after: Value of the Retry-After header in seconds, if any.
+        :return: True to stop retrying.
+        """
+        return (
+            retry_after is not None
+            and self.respect_retry_after
+            and retry_after > self.max_retry_after
+        )
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def configure_retry(
+    policy: typing.Optional[RetryPolicy] = None, family: str = "default"
+) -> None:
+    """
+    Set the retry policy for a family of endpoints.
+
+    A family is either the first path segment of an endpoint (e.g. "historical-chart",
+    "profile"), an API version ("v3", "v4", "stable") or "default".  The most specific
+    match wins.
+    :param policy: The policy to use, NO_RETRY to disable retries, or None to remove
+        the setting for family (the default family falls back to RetryPolicy()).
+    :param family: Endpoint family the policy applies to.
+    :return: None
+    """
+    policies = default_client().retry_policies
+    if policy is None:
+        policies.pop(family, None)
+        if family == "default":
+            policies["default"] = RetryPolicy()
+    else:
+        policies[family] = policy
+
+
+def get_retry_policy(base_url: str, path: str) -> RetryPolicy:
+    """
+    Find the retry policy for an endpoint.
+
+    :param base_url: One of the BASE_URL_* values from settings.
+    :param path: Path after TLD of URL
+    :return: The matching RetryPolicy.
+    """
+    policies = current_client().retry_policies
+    for family in (path.split("/", 1)[0], _API_VERSIONS.get(base_url)):
+        if family in policies:
+            return policies[family]
+    return policies["default"]
+
+
+def parse_retry_after(value: typing.Optional[str]) -> typing.Optional[float]:
+    """
+    Parse a Retry-After header, given either as seconds or as an HTTP date.
+
+    :param value: Header value.
+    :return: Seconds to wait, or None if there was no usable value.
+    """
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
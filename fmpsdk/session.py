@@ -0,0 +1,76 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from .context import current_client, default_client
+from .settings import (
+    DEFAULT_POOL_BLOCK,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+)
+
+
+def new_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = DEFAULT_POOL_BLOCK,
+) -> requests.Session:
+    """
+    Build a requests.Session with a keep-alive connection pool.
+
+    :param pool_connections: Number of per-host connection pools to keep.
+    :param pool_maxsize: Maximum number of connections kept open per host.
+    :param pool_block: True to make threads wait for a free connection instead of
+        opening (and later discarding) extra connections when the pool is exhausted.
+    :return: A configured requests.Session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the session used by fmpsdk requests (that of the active FMPClient).
+
+    The session is created on first use.  It is safe to share between threads; each
+    thread checks a connection out of the pool for the duration of its request.
+    :return: The shared requests.Session.
+    """
+    return current_client().session
+
+
+def configure_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = DEFAULT_POOL_BLOCK,
+) -> None:
+    """
+    Change the connection pool settings of the shared session.
+
+    The current session (if any) is closed and a new one is built on next use.
+    :param pool_connections: Number of per-host connection pools to keep.
+    :param pool_maxsize: Maximum number of connections kept open per host.
+    :param pool_block: True to block when the pool for a host is exhausted.
+    :return: None
+    """
+    default_client().configure_session(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+
+
+def close_session() -> None:
+    """
+    Close the shared session and release its pooled connections.
+
+    :return: None
+    """
+    default_client().close()
@@ -5,6 +5,79 @@ BASE_URL_v4: str = "https://financialmodelingprep.com/api/v4/"
 BASE_URL_STABLE: str = "https://financialmodelingprep.com/stable/"
 DEFAULT_LINE_PARAMETER = "line"
 DEFAULT_LIMIT: int = 10
+DEFAULT_POOL_CONNECTIONS: int = 10
+DEFAULT_POOL_MAXSIZE: int = 32
+DEFAULT_POOL_BLOCK: bool = False
+DEFAULT_ASYNC_POOL_LIMIT: int = 100
+DEFAULT_MAX_WORKERS: int = 16
+DEFAULT_STREAM_CHUNK_SIZE: int = 64 * 1024
+DEFAULT_STREAM_BATCH_SIZE: int = 10000
+DEFAULT_PAGE_PREFETCH: int = 4
+# Limits of one multi-symbol request (quote, batch_quote).
+DEFAULT_BATCH_MAX_SYMBOLS: int = 200
+DEFAULT_BATCH_MAX_PATH_LENGTH: int = 1800
+DEFAULT_POLL_INTERVAL: float = 1.0
+DEFAULT_POLL_MAX_INTERVAL: float = 60.0
+DEFAULT_SYNC_REVISION_BARS: int = 5
+# Longest from/to span of the calendar APIs (the server allows 3 months).
+CALENDAR_WINDOW_DAYS: int = 90
+# Longest from/to span requested at once from historical-chart, by time_delta.
+HISTORICAL_CHART_WINDOW_DAYS: typing.Dict[str, int] = {
+    "1min": 5,
+    "5min": 30,
+    "15min": 60,
+    "30min": 90,
+    "1hour": 180,
+    "4hour": 365,
+}
+DEFAULT_DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024
+DEFAULT_RETRY_MAX_ATTEMPTS: int = 3
+DEFAULT_RETRY_BACKOFF_BASE: float = 0.5
+DEFAULT_RETRY_BACKOFF_CAP: float = 30.0
+DEFAULT_RETRY_MAX_RETRY_AFTER: float = 60.0
+DEFAULT_RETRY_STATUSES: typing.FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+DEFAULT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+# Response cache lifetimes (seconds) by endpoint path prefix; the longest match wins.
+# Endpoints without a match are only cached if a default_ttl is configured.
+REFERENCE_DATA_TTL: int = 24 * 60 * 60
+MARKET_HOURS_TTL: int = 60
+CACHE_TTLS: typing.Dict[str, int] = {
+    "stock/list": REFERENCE_DATA_TTL,
+    "etf/list": REFERENCE_DATA_TTL,
+    "available-traded/list": REFERENCE_DATA_TTL,
+    "available-industries": REFERENCE_DATA_TTL,
+    "sectors-list": REFERENCE_DATA_TTL,
+    "cik_list": REFERENCE_DATA_TTL,
+    "symbol/": REFERENCE_DATA_TTL,
+    "financial-statement-symbol-lists": REFERENCE_DATA_TTL,
+    "delisted-companies": REFERENCE_DATA_TTL,
+    "insider-trading-transaction-type": REFERENCE_DATA_TTL,
+    "commitment_of_traders_report/list": REFERENCE_DATA_TTL,
+    "market-hours": MARKET_HOURS_TTL,
+    "all-exchange-market-hours": MARKET_HOURS_TTL,
+}
+# Disk cache lifetimes (seconds) by endpoint path prefix.  The disk cache is meant for
+# larger payloads that many processes re-fetch: price history and fundamentals.
+HISTORICAL_DATA_TTL: int = 12 * 60 * 60
+FUNDAMENTALS_TTL: int = 24 * 60 * 60
+DISK_CACHE_TTLS: typing.Dict[str, int] = {
+    **CACHE_TTLS,
+    "historical-price-full": HISTORICAL_DATA_TTL,
+    "income-statement": FUNDAMENTALS_TTL,
+    "balance-sheet-statement": FUNDAMENTALS_TTL,
+    "cash-flow-statement": FUNDAMENTALS_TTL,
+    "key-metrics": FUNDAMENTALS_TTL,
+    "ratios": FUNDAMENTALS_TTL,
+    "enterprise-values": FUNDAMENTALS_TTL,
+    "financial-growth": FUNDAMENTALS_TTL,
+}
+# Published per-minute API call limits of the paid FMP plans.
+FMP_PLAN_REQUESTS_PER_MINUTE: typing.Dict[str, int] = {
+    "starter": 300,
+    "premium": 750,
+    "ultimate": 3000,
+}
+DEFAULT_ASYNC_POOL_LIMIT_PER_HOST: int = 0  # 0 means no per-host limit.
 INDUSTRY_VALUES: typing.List = [
     "Entertainment",
     "Oil & Gas Midstream",
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import typing
+import weakref
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into one.
+
+    The first thread to ask for a key (the leader) runs the function; threads that
+    ask for the same key while it runs wait and receive the leader's result (or
+    exception).  Nothing is remembered once the call finishes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: typing.Dict[typing.Hashable, _Call] = {}
+
+    def do(
+        self, key: typing.Hashable, func: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        """
+        Run func, or wait for the identical call already running.
+
+        :param key: Identifies identical calls.
+        :param func: Called without arguments by the leader.
+        :return: What func returned.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines; calls are only shared within one event loop."""
+
+    def __init__(self):
+        # event loop -> {key: task}
+        self._calls = weakref.WeakKeyDictionary()
+
+    async def do(
+        self,
+        key: typing.Hashable,
+        func: typing.Callable[[], typing.Awaitable[typing.Any]],
+    ) -> typing.Any:
+        """
+        Await func(), or the identical call already running.
+
+        :param key: Identifies identical calls.
+        :param func: Coroutine function called without arguments by the leader.
+        :return: What func returned.
+        """
+        loop = asyncio.get_running_loop()
+        calls = self._calls.setdefault(loop, {})
+        task = calls.get(key)
+        if task is None:
+            # The call runs in its own task, so cancelling the caller that started
+            # it (e.g. its own wait_for timeout) does not cancel it for the others.
+            task = calls[key] = loop.create_task(func())
+
+            def finished(done: asyncio.Task) -> None:
+                if calls.get(key) is done:
+                    del calls[key]
+                if not done.cancelled():
+                    done.exception()  # Mark retrieved; there may be no waiters left.
+
+            task.add_done_callback(finished)
+        # shield: a cancelled caller must not cancel everyone else's result.
+        return await asyncio.shield(task)
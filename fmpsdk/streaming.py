@@ -0,0 +1,305 @@
+import codecs
+import itertools
+import json
+import typing
+
+from .coercion import column_records, csv_column_batches
+from .settings import DEFAULT_STREAM_BATCH_SIZE, DEFAULT_STREAM_CHUNK_SIZE
+from .url_methods import PreparedRequest, SplitRequest, __capture_request, __send
+
+# Responses that wrap their rows in an object, by endpoint path prefix.  The first key
+# present is streamed (mirrors historical_price_full's unwrapping).
+ROWS_KEYS: typing.Dict[str, typing.Tuple[str, ...]] = {
+    "historical-price-full": ("historicalStockList", "historical"),
+}
+
+
+class _JsonReader:
+    """Pull JSON values one at a time from a stream of byte chunks."""
+
+    def __init__(self, chunks: typing.Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk into the buffer.  Returns False at end of stream."""
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            text = self._text.decode(b"", final=True)
+        else:
+            text = self._text.decode(chunk)
+        # Drop what has been consumed so the buffer stays about one chunk long.
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at end)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def skip(self) -> None:
+        """Consume the character returned by peek()."""
+        self._pos += 1
+
+    def value(self) -> typing.Any:
+        """Decode and consume one complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut by the end of the chunk ("12" of "123", "1.5" of "1.5e3")
+            # decodes fine; only trust it when a delimiter follows.
+            if (
+                end == len(self._buf)
+                or isinstance(value, (int, float))
+                and self._buf[end] not in ",]} \t\r\n"
+            ) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_array(
+    chunks: typing.Iterable[bytes],
+    rows_keys: typing.Sequence[str] = (),
+) -> typing.Iterator[typing.Any]:
+    """
+    Yield the elements of a JSON array as its bytes arrive.
+
+    Only one element (plus one chunk of input) is held in memory at a time.
+    :param chunks: The response body in pieces, e.g. response.iter_content().
+    :param rows_keys: If the document is an object, stream the array held by the
+        first of these keys instead.
+    :return: An iterator of decoded elements.
+    """
+    reader = _JsonReader(chunks)
+    first = reader.peek()
+    if first == "":
+        return
+    if first == "{" and rows_keys:
+        reader.skip()
+        while reader.peek() not in ("}", ""):
+            if reader.peek() == ",":
+                reader.skip()
+                continue
+            key = reader.value()
+            if reader.peek() != ":":
+                raise ValueError("Malformed JSON object in response.")
+            reader.skip()
+            if key in rows_keys and reader.peek() == "[":
+                yield from _iter_elements(reader)
+                return
+            reader.value()
+        return
+    if first != "[":
+        raise ValueError(f"Expected a JSON array, got: {reader.value()}")
+    yield from _iter_elements(reader)
+
+
+def _iter_elements(reader: _JsonReader) -> typing.Iterator[typing.Any]:
+    reader.skip()  # "["
+    while True:
+        c = reader.peek()
+        if c == "]":
+            reader.skip()
+            return
+        if c == ",":
+            reader.skip()
+        elif c == "":
+            raise ValueError("Response ended in the middle of a JSON array.")
+        else:
+            yield reader.value()
+
+
+def iter_text_lines(
+    chunks: typing.Iterable[bytes], encoding: str = "utf-8-sig"
+) -> typing.Iterator[str]:
+    """
+    Decode a stream of byte chunks into lines, keeping their line endings.
+
+    The lines can be fed straight to csv.reader(), which also handles quoted fields
+    that span lines.
+    :param chunks: The response body in pieces, e.g. response.iter_content().
+    :param encoding: Text encoding; the default drops a leading byte order mark.
+    :return: An iterator of lines.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    tail = ""
+    for chunk in chunks:
+        lines = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _stream_request(
+    func: typing.Callable,
+    args: typing.Tuple,
+    kwargs: typing.Dict,
+    chunk_size: int,
+    batch_size: int,
+) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    """
+    Capture the request func would send and stream its response.
+
+    Yields a single ("result", value) when func returned without sending a request,
+    otherwise ("csv", column batches) or ("json", rows) for the response body.  CSV
+    columns are typed like the regular functions' results (see coercion.py).  Calls
+    split into several requests stream them one after another as ("json", rows),
+    without the rows an earlier request already returned.
+    """
+    request, result = __capture_request(func, *args, **kwargs)
+    if request is None:
+        yield "result", result or []
+        return
+    if isinstance(request, SplitRequest):
+        yield "json", _split_rows(request, chunk_size, batch_size)
+        return
+    if request.filename is not None:
+        raise ValueError("Streaming is not available for download=True calls.")
+    yield from _stream_response(request, chunk_size, batch_size)
+
+
+def _stream_response(
+    request: PreparedRequest, chunk_size: int, batch_size: int
+) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    response = __send(request.base_url, request.path, request.query_vars, stream=True)
+    with response:
+        response.raise_for_status()
+        chunks = response.iter_content(chunk_size)
+        if request.query_vars.get("datatype") == "csv":
+            lines = iter_text_lines(chunks)
+            yield "csv", csv_column_batches(lines, request.path, batch_size)
+        else:
+            rows_keys = next(
+                (
+                    keys
+                    for prefix, keys in ROWS_KEYS.items()
+                    if request.path.startswith(prefix)
+                ),
+                (),
+            )
+            yield "json", iter_json_array(chunks, rows_keys)
+
+
+def _split_rows(
+    request: SplitRequest, chunk_size: int, batch_size: int
+) -> typing.Iterator[typing.Dict]:
+    seen = set()
+    for part in request.requests:
+        for kind, body in _stream_response(part, chunk_size, batch_size):
+            rows = (
+                itertools.chain.from_iterable(map(column_records, body))
+                if kind == "csv"
+                else body
+            )
+            for row in rows:
+                if request.key is None:
+                    yield row
+                    continue
+                row_key = request.key(row)
+                if row_key not in seen:
+                    seen.add(row_key)
+                    yield row
+
+
+def iter_rows(
+    func: typing.Callable,
+    *args,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    **kwargs,
+) -> typing.Iterator[typing.Dict]:
+    """
+    Call an endpoint function and yield its rows while the response downloads.
+
+    Use this for endpoints that return very large responses (symbols_list,
+    available_traded_list, full_real_time_price, bulk_profiles,
+    upgrades_downgrades_consensus_bulk(download=True), ...): memory use is bounded
+    by chunk_size and processing starts with the first row.  JSON arrays and
+    datatype=csv responses are both parsed incrementally.  Rate limiting and
+    retries apply as usual; the response cache is bypassed.  Calls that the regular
+    functions split into several requests (long historical_chart or calendar ranges,
+    long symbol lists) are streamed one request after another, newest window first
+    for date ranges, and rows repeated by a later request are skipped.  Unlike the
+    regular functions, request errors are raised (HTTP errors as requests.HTTPError) since
+    a generator has no None to return.
+
+    Example:
+        for row in iter_rows(fmpsdk.symbols_list, apikey=apikey):
+            ...
+    :param func: An fmpsdk endpoint function.
+    :param chunk_size: Bytes read from the socket at a time.
+    :param args: Arguments for func.
+    :param kwargs: Arguments for func.
+    :return: An iterator of dictionaries.
+    """
+    for kind, body in _stream_request(
+        func, args, kwargs, chunk_size, DEFAULT_STREAM_BATCH_SIZE
+    ):
+        if kind == "csv":
+            for columns in body:
+                yield from column_records(columns)
+        else:
+            yield from body
+
+
+def iter_batches(
+    func: typing.Callable,
+    *args,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    columnar: bool = False,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    **kwargs,
+) -> typing.Iterator[typing.Union[typing.List[typing.Dict], typing.Dict[str, list]]]:
+    """
+    Like iter_rows(), but yield the rows in batches.
+
+    With columnar=True each batch is a dictionary of column name -> list of values.
+    For CSV responses the columns are built straight from the parsed fields, without
+    a dictionary per row.
+    :param func: An fmpsdk endpoint function.
+    :param batch_size: Rows per batch (the last batch may be shorter).
+    :param columnar: True for column batches, False for lists of row dictionaries.
+    :param chunk_size: Bytes read from the socket at a time.
+    :param args: Arguments for func.
+    :param kwargs: Arguments for func.
+    :return: An iterator of batches.
+    """
+    for kind, body in _stream_request(func, args, kwargs, chunk_size, batch_size):
+        if kind == "csv":
+            for columns in body:
+                yield columns if columnar else column_records(columns)
+            return
+        rows = iter(body)
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                return
+            yield _row_columns(batch) if columnar else batch
+
+
+def _row_columns(batch: typing.List[typing.Dict]) -> typing.Dict[str, list]:
+    names = {}
+    for row in batch:
+        names.update(dict.fromkeys(row))
+    return {name: [row.get(name) for row in batch] for name in names}
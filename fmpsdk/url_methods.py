@@ -1,11 +1,18 @@
+import contextlib
+import contextvars
 import csv
-import io
+import json
 import logging
+import os
+import secrets
+import stat
+import time
 import typing
 
 import requests
 
 from .settings import (
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
     INDUSTRY_VALUES,
     PERIOD_VALUES,
     SECTOR_VALUES,
@@ -18,6 +25,14 @@ from .settings import (
     BASE_URL_STABLE,
     ECONOMIC_INDICATOR_VALUES,
 )
+from .cache import MISS, cache_key, get_cache
+from .coercion import csv_records
+from .context import current_client
+from .disk_cache import get_disk_cache
+from .rate_limit import get_rate_limiter
+from .retry import get_retry_policy, parse_retry_after
+from .session import get_session
+from .single_flight import SingleFlight
 
 CONNECT_TIMEOUT = 5
 READ_TIMEOUT = 30
@@ -27,165 +42,550 @@ logging.getLogger("requests").setLevel(logging.WARNING)
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
-def __return_json_v3(
-    path: str, query_vars: typing.Dict
+class PreparedRequest(typing.NamedTuple):
+    """Everything needed to send one FMP request, as built by an endpoint function."""
+
+    base_url: str
+    path: str
+    query_vars: typing.Dict
+    transform: typing.Optional[typing.Callable] = None
+    filename: typing.Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return f"{self.base_url}{self.path}"
+
+
+class SplitRequest(typing.NamedTuple):
+    """
+    Several requests that together answer one call (long date ranges, long symbol
+    lists), as built by ranges.fetch_range() and batching.fetch_chunked().
+    """
+
+    requests: typing.List[PreparedRequest]
+    # Combines the parsed results of requests, in order, like the regular function.
+    merge: typing.Callable[[typing.List], typing.Any]
+    # Identity of a row; rows seen in an earlier request are repeats.  None when the
+    # requests never overlap.
+    key: typing.Optional[typing.Callable[[typing.Dict], typing.Hashable]]
+
+    @property
+    def url(self) -> str:
+        return self.requests[0].url
+
+    @property
+    def path(self) -> str:
+        return self.requests[0].path
+
+    @property
+    def filename(self) -> typing.Optional[str]:
+        return None
+
+
+class RequestCaptured(Exception):
+    """Raised instead of sending a request while requests are being captured."""
+
+    def __init__(self, request: typing.Union[PreparedRequest, SplitRequest]):
+        super().__init__(request.url)
+        self.request = request
+
+
+_capturing: contextvars.ContextVar = contextvars.ContextVar(
+    "fmpsdk_capturing", default=False
+)
+_raising: contextvars.ContextVar = contextvars.ContextVar(
+    "fmpsdk_raising", default=False
+)
+_in_flight = SingleFlight()
+
+
+def __capture_request(
+    func: typing.Callable, *args, **kwargs
+) -> typing.Tuple[typing.Union[PreparedRequest, SplitRequest, None], typing.Any]:
+    """
+    Run an endpoint function without touching the network.
+
+    This lets other front ends (asyncio, streaming, ...) reuse the path and query
+    building of the regular functions.
+    :param func: An fmpsdk endpoint function.
+    :return: (request, None) for the request func would send (a SplitRequest when
+        func sends several), or (None, result) when func returned without sending
+        one (e.g. failed input validation).
+    """
+    token = _capturing.set(True)
+    try:
+        result = func(*args, **kwargs)
+    except RequestCaptured as captured:
+        return captured.request, None
+    finally:
+        _capturing.reset(token)
+    return None, result
+
+
+def __capture_split(
+    func: typing.Callable,
+    calls: typing.List[typing.Dict],
+    merge: typing.Callable[[typing.List], typing.Any],
+    key: typing.Optional[typing.Callable[[typing.Dict], typing.Hashable]],
+) -> typing.Any:
+    """
+    Capture the requests of several calls as one SplitRequest.
+
+    Only used while capturing (see __capture_request): raises RequestCaptured.
+    :param func: Function that sends one request.
+    :param calls: Keyword arguments of each call, in the order of the merged result.
+    :param merge: See SplitRequest.
+    :param key: See SplitRequest.
+    :return: The result of a call that sent no request (e.g. failed validation).
+    """
+    parts = []
+    for kwargs in calls:
+        try:
+            result = func(**kwargs)
+        except RequestCaptured as captured:
+            parts.append(captured.request)
+        else:
+            return result
+    raise RequestCaptured(SplitRequest(parts, merge, key))
+
+
+def __call_raising(func: typing.Callable, *args, **kwargs) -> typing.Any:
+    """
+    Run an endpoint function, letting request errors propagate.
+
+    Normally a failed request is logged and the endpoint returns None.  Callers that
+    need to know why a request failed (e.g. fetch_many) use this instead.  HTTP error
+    statuses are raised as requests.HTTPError.
+    :param func: An fmpsdk endpoint function.
+    :return: Whatever func returns.
+    """
+    token = _raising.set(True)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _raising.reset(token)
+
+
+def __parse_content(
+    content: bytes,
+    query_vars: typing.Dict,
+    transform: typing.Optional[typing.Callable] = None,
+    path: str = "",
 ) -> typing.Optional[typing.List]:
     """
-    Query URL for JSON response for v3 of FMP API.
+    Turn a raw response body into the value returned to the caller.
+
+    CSV responses are converted to typed values per coercion.CSV_SCHEMAS.
+    :param content: Response body.
+    :param query_vars: Dictionary of query values the request was sent with.
+    :param transform: Optional callable applied to non-empty results.
+    :param path: Path after TLD of URL
+    :return: JSON response
+    """
+    return_var = None
+    if len(content) > 0:
+        if query_vars.get("datatype") == "csv":
+            try:
+                return_var = csv_records(content.decode("utf-8-sig"), path)
+            except csv.Error as e:
+                logging.error(f"Failed to parse CSV response: {e}")
+                raise e
+        else:
+            return_var = json.loads(content)
+
+    if len(content) == 0 or (
+        isinstance(return_var, dict) and len(return_var.keys()) == 0
+    ):
+        logging.warning("Response appears to have no data.  Returning empty List.")
+        return_var = []
+
+    if return_var and transform is not None:
+        return_var = transform(return_var)
+    return return_var
+
+
+def __return_json(
+    base_url: str,
+    path: str,
+    query_vars: typing.Dict,
+    transform: typing.Optional[typing.Callable] = None,
+) -> typing.Optional[typing.List]:
+    """
+    Query URL for JSON response.
 
+    All versions of the FMP API share this code path (and the pooled session).
+    :param base_url: One of the BASE_URL_* values from settings.
     :param path: Path after TLD of URL
     :param query_vars: Dictionary of query values (after "?" of URL)
+    :param transform: Optional callable applied to non-empty results.
     :return: JSON response
     """
-    url = f"{BASE_URL_v3}{path}"
+    if _capturing.get():
+        raise RequestCaptured(
+            PreparedRequest(base_url, path, query_vars, transform=transform)
+        )
+    key, return_var = __cache_lookup(base_url, path, query_vars, transform)
+    if return_var is not MISS:
+        return return_var
+    # Identical requests already on their way share that round trip.
+    return _in_flight.do(
+        __flight_key(base_url, path, query_vars),
+        lambda: __fetch_json(base_url, path, query_vars, transform, key),
+    )
+
+
+def __flight_key(base_url: str, path: str, query_vars: typing.Dict) -> typing.Tuple:
+    """
+    Identify requests that may share one round trip.
+
+    :param base_url: One of the BASE_URL_* values from settings.
+    :param path: Path after TLD of URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :return: A hashable key.
+    """
+    return (
+        cache_key(base_url, path, query_vars),
+        query_vars.get("apikey"),
+        _raising.get(),
+    )
+
+
+def __fetch_json(
+    base_url: str,
+    path: str,
+    query_vars: typing.Dict,
+    transform: typing.Optional[typing.Callable],
+    key: typing.Optional[str],
+) -> typing.Optional[typing.List]:
+    """
+    Send the request, parse the response and cache it.
+
+    :param base_url: One of the BASE_URL_* values from settings.
+    :param path: Path after TLD of URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :param transform: Optional callable applied to non-empty results.
+    :param key: Cache key from __cache_lookup(), or None to skip caching.
+    :return: JSON response
+    """
+    url = f"{base_url}{path}"
     return_var = None
     try:
-        response = requests.get(
-            url, params=query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
-        )
-        if len(response.content) > 0:
-            if query_vars.get('datatype') == 'csv':
-                content = response.content.decode("utf-8")
-                try:
-                    reader = csv.DictReader(io.StringIO(content))
-                    return_var = [row for row in reader]
-                except csv.Error as e:
-                    logging.error(f"Failed to parse CSV response: {e}")
-                    raise e
-            else:
-                return_var = response.json()
-
-        if len(response.content) == 0 or (
-            isinstance(return_var, dict) and len(return_var.keys()) == 0
-        ):
-            logging.warning("Response appears to have no data.  Returning empty List.")
-            return_var = []
-
-    except requests.Timeout:
+        response = __send(base_url, path, query_vars)
+        if _raising.get():
+            response.raise_for_status()
+        return_var = __parse_content(response.content, query_vars, transform, path)
+        if key is not None and response.ok:
+            __cache_store(key, path, return_var, response.content)
+    except Exception as e:
+        if _raising.get():
+            raise
+        __log_request_error(url, e)
+    return return_var
+
+
+def __cache_lookup(
+    base_url: str,
+    path: str,
+    query_vars: typing.Dict,
+    transform: typing.Optional[typing.Callable] = None,
+) -> typing.Tuple[typing.Optional[str], typing.Any]:
+    """
+    Look a request up in the memory cache, then in the disk cache.
+
+    Disk hits are parsed and promoted to the memory cache.
+    :param base_url: One of the BASE_URL_* values from settings.
+    :param path: Path after TLD of URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :param transform: Optional callable applied to non-empty results.
+    :return: (key, value).  key is None if the response must not be cached; value is
+        MISS unless there was a hit.
+    """
+    memory, disk = get_cache(), get_disk_cache()
+    memory_ttl = memory.ttl_for(path) if memory is not None else 0
+    disk_ttl = disk.ttl_for(path) if disk is not None else 0
+    if memory_ttl <= 0 and disk_ttl <= 0:
+        return None, MISS
+    key = cache_key(base_url, path, query_vars)
+    if memory_ttl > 0:
+        value = memory.get(key)
+        if value is not MISS:
+            return key, value
+    if disk_ttl > 0:
+        content = disk.get(key)
+        if content is not None:
+            value = __parse_content(content, query_vars, transform, path)
+            if memory_ttl > 0:
+                memory.set(key, value, len(content), memory_ttl)
+            return key, value
+    return key, MISS
+
+
+def __cache_store(key: str, path: str, value: typing.Any, content: bytes) -> None:
+    """
+    Put a response in the memory and disk caches.
+
+    :param key: Key returned by __cache_lookup().
+    :param path: Path after TLD of URL
+    :param value: Parsed response.
+    :param content: Response body.
+    :return: None
+    """
+    memory, disk = get_cache(), get_disk_cache()
+    if memory is not None and value is not None:
+        memory.set(key, value, len(content), memory.ttl_for(path))
+    if disk is not None:
+        disk.set(key, content, disk.ttl_for(path))
+
+
+def __send(
+    base_url: str, path: str, query_vars: typing.Dict, stream: bool = False
+) -> requests.Response:
+    """
+    Send a GET request, retrying transient failures per the endpoint's RetryPolicy.
+
+    Every attempt waits for the rate limiter first.  When attempts run out, the last
+    response is returned (or the last exception raised) as if there was no retry.
+    So is a response whose Retry-After is longer than the policy's max_retry_after.
+    :param base_url: One of the BASE_URL_* values from settings.
+    :param path: Path after TLD of URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :param stream: True to return before the body is downloaded; the caller must
+        then close the response.
+    :return: The response.
+    """
+    url = f"{base_url}{path}"
+    policy = get_retry_policy(base_url, path)
+    attempts = max(1, policy.max_attempts)
+    for attempt in range(attempts):
+        last_attempt = attempt + 1 >= attempts
+        retry_after = None
+        __throttle()
+        try:
+            response = get_session().get(
+                url,
+                params=query_vars,
+                timeout=__timeout(),
+                stream=stream,
+            )
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if last_attempt:
+                raise
+            logging.warning(f"Request to {url} failed ({e}).  Retrying.")
+        else:
+            if response.status_code not in policy.retry_statuses or last_attempt:
+                return response
+            if response.status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if policy.gives_up(retry_after):
+                logging.warning(
+                    f"Request to {url} asked to retry after {retry_after:.0f} s.  "
+                    "Giving up."
+                )
+                return response
+            logging.warning(
+                f"Request to {url} returned HTTP {response.status_code}.  Retrying."
+            )
+            response.close()
+        time.sleep(policy.delay(attempt, retry_after))
+
+
+def __throttle() -> None:
+    """
+    Wait until the configured rate limiter (if any) allows another request.
+
+    :return: None
+    """
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        limiter.acquire()
+
+
+def __timeout() -> typing.Tuple[float, float]:
+    """
+    Return the (connect, read) timeouts of the active FMPClient.
+
+    :return: Timeouts in seconds.
+    """
+    client = current_client()
+    return (
+        CONNECT_TIMEOUT if client.connect_timeout is None else client.connect_timeout,
+        READ_TIMEOUT if client.read_timeout is None else client.read_timeout,
+    )
+
+
+def __log_request_error(url: str, e: Exception) -> None:
+    """
+    Log a failed request the same way for every API version.
+
+    :param url: URL that was queried.
+    :param e: The exception raised while sending the request or parsing the response.
+    :return: None
+    """
+    if isinstance(e, requests.Timeout):
         logging.error(f"Connection to {url} timed out.")
-    except requests.ConnectionError:
+    elif isinstance(e, requests.ConnectionError):
         logging.error(
             f"Connection to {url} failed:  DNS failure, refused connection or some other connection related "
             f"issue."
         )
-    except requests.TooManyRedirects:
+    elif isinstance(e, requests.TooManyRedirects):
         logging.error(
             f"Request to {url} exceeds the maximum number of predefined redirections."
         )
-    except Exception as e:
+    else:
         logging.error(
             f"A requests exception has occurred that we have not yet detailed an 'except' clause for.  "
             f"Error: {e}"
         )
 
-    return return_var
+
+def __return_json_v3(
+    path: str,
+    query_vars: typing.Dict,
+    transform: typing.Optional[typing.Callable] = None,
+) -> typing.Optional[typing.List]:
+    """
+    Query URL for JSON response for v3 of FMP API.
+
+    :param path: Path after TLD of URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :param transform: Optional callable applied to non-empty results.
+    :return: JSON response
+    """
+    return __return_json(
+        base_url=BASE_URL_v3, path=path, query_vars=query_vars, transform=transform
+    )
 
 
 def __return_json_v4(
-    path: str, query_vars: typing.Dict
+    path: str,
+    query_vars: typing.Dict,
+    transform: typing.Optional[typing.Callable] = None,
 ) -> typing.Optional[typing.List]:
     """
     Query URL for JSON response for v4 of FMP API.
 
     :param path: Path after TLD of URL
     :param query_vars: Dictionary of query values (after "?" of URL)
+    :param transform: Optional callable applied to non-empty results.
     :return: JSON response
     """
-    url = f"{BASE_URL_v4}{path}"
-    return_var = None
-    try:
-        response = requests.get(
-            url, params=query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
-        )
-        if len(response.content) > 0:
-            if query_vars.get('datatype') == 'csv':
-                content = response.content.decode("utf-8")
-                try:
-                    reader = csv.DictReader(io.StringIO(content))
-                    return_var = [row for row in reader]
-                except csv.Error as e:
-                    logging.error(f"Failed to parse CSV response: {e}")
-                    raise e
-            else:
-                return_var = response.json()
-
-        if len(response.content) == 0 or (
-            isinstance(return_var, dict) and len(return_var.keys()) == 0
-        ):
-            logging.warning("Response appears to have no data.  Returning empty List.")
-            return_var = []
-
-    except requests.Timeout:
-        logging.error(f"Connection to {url} timed out.")
-    except requests.ConnectionError:
-        logging.error(
-            f"Connection to {url} failed:  DNS failure, refused connection or some other connection related "
-            f"issue."
-        )
-    except requests.TooManyRedirects:
-        logging.error(
-            f"Request to {url} exceeds the maximum number of predefined redirections."
-        )
-    except Exception as e:
-        logging.error(
-            f"A requests exception has occurred that we have not yet detailed an 'except' clause for.  "
-            f"Error: {e}"
-        )
-    return return_var
+    return __return_json(
+        base_url=BASE_URL_v4, path=path, query_vars=query_vars, transform=transform
+    )
 
 
 def __return_json_stable(
-    path: str, query_vars: typing.Dict
+    path: str,
+    query_vars: typing.Dict,
+    transform: typing.Optional[typing.Callable] = None,
 ) -> typing.Optional[typing.List]:
     """
     Query URL for JSON response for stable version of FMP API.
 
     :param path: Path after TLD of URL
     :param query_vars: Dictionary of query values (after "?" of URL)
+    :param transform: Optional callable applied to non-empty results.
     :return: JSON response
     """
-    
-    url = f"{BASE_URL_STABLE}{path}"
-    return_var = None
-    try:
-        response = requests.get(
-            url, params=query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
-        )
-        if len(response.content) > 0:
-            if query_vars.get('datatype') == 'csv':
-                content = response.content.decode("utf-8")
-                try:
-                    reader = csv.DictReader(io.StringIO(content))
-                    return_var = [row for row in reader]
-                except csv.Error as e:
-                    logging.error(f"Failed to parse CSV response: {e}")
-                    raise e
-            else:
-                return_var = response.json()
-
-        if len(response.content) == 0 or (
-            isinstance(return_var, dict) and len(return_var.keys()) == 0
-        ):
-            logging.warning("Response appears to have no data.  Returning empty List.")
-            return_var = []
-
-    except requests.Timeout:
-        logging.error(f"Connection to {url} timed out.")
-    except requests.ConnectionError:
-        logging.error(
-            f"Connection to {url} failed:  DNS failure, refused connection or some other connection related "
-            f"issue."
-        )
-    except requests.TooManyRedirects:
-        logging.error(
-            f"Request to {url} exceeds the maximum number of predefined redirections."
+    return __return_json(
+        base_url=BASE_URL_STABLE, path=path, query_vars=query_vars, transform=transform
+    )
+
+
+def __download_v3(path: str, query_vars: typing.Dict, filename: str) -> bool:
+    """
+    Save the body of a v3 FMP API response to a file.
+
+    The body is streamed to a temporary file next to filename in chunks, checked
+    against the Content-Length header and then renamed over filename, so filename is
+    never left truncated.
+    :param path: Path after TLD of URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :param filename: Name of saved file.
+    :return: True if filename was saved; False if the download failed (and was
+        logged), leaving any earlier file in place.
+    """
+    if _capturing.get():
+        raise RequestCaptured(
+            PreparedRequest(BASE_URL_v3, path, query_vars, filename=filename)
         )
+    url = f"{BASE_URL_v3}{path}"
+    try:
+        with __send(BASE_URL_v3, path, query_vars, stream=True) as response:
+            response.raise_for_status()
+            with __atomic_writer(filename) as f:
+                for chunk in response.iter_content(DEFAULT_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                # raw.tell() counts bytes off the wire, like Content-Length does,
+                # even when the body was gzip-encoded.
+                __verify_length(url, response.headers, response.raw.tell())
     except Exception as e:
-        logging.error(
-            f"A requests exception has occurred that we have not yet detailed an 'except' clause for.  "
-            f"Error: {e}"
+        if _raising.get():
+            raise
+        __log_request_error(url, e)
+        return False
+    return True
+
+
+@contextlib.contextmanager
+def __atomic_writer(filename: str) -> typing.Iterator[typing.BinaryIO]:
+    """
+    Open a temporary file that replaces filename only if the block succeeds.
+
+    :param filename: Name of saved file.
+    :return: A binary file object.
+    """
+    directory, name = os.path.split(os.path.abspath(filename))
+    fd, temp_name = __create_temp_file(directory, name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(temp_name, stat.S_IMODE(os.stat(filename).st_mode))
+        except FileNotFoundError:
+            pass  # A new file keeps the mode it was created with.
+        os.replace(temp_name, filename)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+def __create_temp_file(directory: str, name: str) -> typing.Tuple[int, str]:
+    """
+    Create an empty, uniquely named file next to the file name it will replace.
+
+    Unlike tempfile.mkstemp(), which creates files for their owner only (0600), the
+    file gets mode 0o666 less the umask, like a plain open() would give it.
+    :param directory: Directory of the saved file.
+    :param name: Base name of the saved file.
+    :return: The open file descriptor and the file's path.
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    while True:
+        temp_name = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.part")
+        try:
+            return os.open(temp_name, flags, 0o666), temp_name
+        except FileExistsError:
+            continue
+
+
+def __verify_length(url: str, headers: typing.Mapping, received: int) -> None:
+    """
+    Make sure a download was not cut short.
+
+    :param url: URL that was downloaded.
+    :param headers: Response headers.
+    :param received: Number of body bytes received, before any decoding.
+    :return: None
+    """
+    expected = headers.get("Content-Length")
+    if expected is not None and int(expected) != received:
+        raise IOError(
+            f"Download of {url} is incomplete: received {received} of {expected} bytes."
         )
-    return return_var
 
 
 def __validate_period(value: str) -> str:
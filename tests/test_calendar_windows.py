@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+import fmpsdk
+import fmpsdk.aio
+from fmpsdk import url_methods
+
+CALENDARS = [
+    "earning_calendar",
+    "ipo_calendar",
+    "stock_split_calendar",
+    "dividend_calendar",
+    "economic_calendar",
+]
+
+
+def _request_key(path, query_vars):
+    return path, query_vars.get("from"), query_vars.get("to")
+
+
+@pytest.mark.parametrize("name", CALENDARS)
+def test_aio_sends_the_same_windows_as_sync(monkeypatch, name):
+    sent_sync, sent_aio = [], []
+
+    def fake_fetch_json(base_url, path, query_vars, transform, key):
+        sent_sync.append(_request_key(path, query_vars))
+        return []
+
+    async def fake_aio_fetch_json(request, key):
+        sent_aio.append(_request_key(request.path, request.query_vars))
+        return []
+
+    monkeypatch.setattr(url_methods, "__fetch_json", fake_fetch_json)
+    monkeypatch.setattr(fmpsdk.aio, "_fetch_json", fake_aio_fetch_json)
+    kwargs = {"apikey": "demo", "from_date": "2020-01-01", "to_date": "2024-01-01"}
+
+    getattr(fmpsdk, name)(**kwargs)
+    asyncio.run(getattr(fmpsdk.aio, name)(**kwargs))
+
+    assert len(sent_sync) > 1
+    assert sorted(sent_aio) == sorted(sent_sync)
+    for _, from_date, to_date in sent_sync:
+        assert from_date <= to_date
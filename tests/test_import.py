@@ -0,0 +1,46 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies a bare "import fmpsdk" must not load (see fmpsdk/__init__.py).
+HEAVY_MODULES = [
+    "requests",
+    "urllib3",
+    "aiohttp",
+    "asyncio",
+    "numpy",
+    "pandas",
+    "pyarrow",
+    "sqlite3",
+    "dotenv",
+]
+
+
+def _loaded_after(statement):
+    code = (
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env=dict(os.environ, PYTHONPATH=ROOT),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def test_import_fmpsdk_loads_no_heavy_dependency():
+    assert _loaded_after("import fmpsdk") == []
+
+
+def test_dir_and_all_load_no_heavy_dependency():
+    assert _loaded_after("import fmpsdk; dir(fmpsdk); fmpsdk.__all__") == []
+
+
+def test_endpoint_functions_load_on_first_use():
+    assert "requests" in _loaded_after("import fmpsdk; fmpsdk.quote")